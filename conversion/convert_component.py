@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Main script to convert React components to Jinja templates."""
 
+import json
+import re
 import sys
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -19,19 +22,156 @@ from conversion.parsers.jsx_structure_parser import JsxStructureParser
 from conversion.parsers.nested_component_detector import NestedComponentDetector
 from conversion.parsers.array_shape_analyzer import ArrayShapeAnalyzer
 from conversion.generators.jinja_generator import JinjaGenerator
-from conversion.generators.class_builder import ClassBuilder
 from conversion.generators.definition_generator import DefinitionGenerator
-from conversion.customizations.customization_loader import CustomizationLoader
+from conversion.customizations.customization_loader import get_default_loader
 from conversion.utils.file_helpers import (
     read_file,
+    read_json,
     write_file,
+    write_json,
     get_rvo_components_dir,
     get_output_template_dir,
     get_conversion_dir,
-    file_exists
+    file_exists,
+    list_dir_names
 )
 
 
+# First component tag of the JSX return value, optionally wrapped in "("
+_ROOT_TAG_RE = re.compile(r'\s*\(?\s*<([A-Z][A-Za-z0-9]*)')
+
+# Cheap gates: skip the full parsers when their input cannot match
+_HAS_COMPONENT_TAG_RE = re.compile(r'<[A-Z]')
+_HAS_CLSX_RE = re.compile(r'clsx\s*\(')
+
+# Tokens that differ between a TypeScript array literal and JSON: string
+# literals (kept intact, single quotes converted), `as const`, trailing
+# commas and bare object keys
+_TS_TOKEN_RE = re.compile(
+    r'"((?:[^"\\]|\\.)*)"'
+    r"|'((?:[^'\\]|\\.)*)'"
+    r'|(\s+as\s+const\b)'
+    r'|(,)(?=\s*[}\]])'
+    r'|(\w+)(?=\s*:)'
+)
+
+
+def _ts_replace_token(match: re.Match) -> str:
+    """Rewrite a single TypeScript token for JSON (see _TS_TOKEN_RE)."""
+    double_quoted, single_quoted, as_const, trailing_comma, key = match.groups()
+    if double_quoted is not None:
+        return match.group(0)
+    if single_quoted is not None:
+        value = single_quoted.replace("\\'", "'").replace('"', '\\"')
+        return f'"{value}"'
+    if key is not None:
+        return f'"{key}"'
+    # `as const` and trailing commas are dropped
+    return ''
+
+
+def _ts_to_json(ts_literal: str) -> str:
+    """Convert a TypeScript array/object literal to JSON in a single pass.
+
+    Args:
+        ts_literal: Literal like "[{ label: 'Step 1', }] as const"
+
+    Returns:
+        JSON string like '[{ "label": "Step 1"}]'
+    """
+    return _TS_TOKEN_RE.sub(_ts_replace_token, ts_literal)
+
+
+class _AliasRegistry:
+    """Pending alias registrations for overall_definitions.json.
+
+    Aliases are applied to an in-memory copy of the file and written by
+    flush(). Outside of a batch() block every conversion flushes right away;
+    inside one, all conversions share a single read and a single write.
+    """
+
+    def __init__(self, definitions_path: Path):
+        self.definitions_path = definitions_path
+        self._data: Optional[Dict[str, Any]] = None
+        self._aliases_by_name: Dict[str, Dict[str, Any]] = {}
+        self._batch_depth = 0
+
+    @property
+    def batching(self) -> bool:
+        """Whether writes are currently deferred to the end of a batch."""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes until the outermost batch block exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def queue(self, alias_name: str, target_component: str) -> bool:
+        """Register an alias, loading the definitions file on first use.
+
+        Args:
+            alias_name: Alias to register
+            target_component: Component the alias points to
+
+        Returns:
+            True if an existing alias was updated, False if a new one was added
+        """
+        if self._data is None:
+            self._data = read_json(self.definitions_path)
+            # Ensure aliases array exists
+            self._data.setdefault("aliases", [])
+            # Index existing aliases by name (first entry wins)
+            self._aliases_by_name = {a["name"]: a for a in reversed(self._data["aliases"])}
+
+        description = f"Alias for {target_component}"
+        existing_alias = self._aliases_by_name.get(alias_name)
+        if existing_alias:
+            # Update existing alias to point to new target
+            existing_alias["target_component"] = target_component
+            existing_alias["description"] = description
+            return True
+
+        new_alias = {
+            "name": alias_name,
+            "target_component": target_component,
+            "default_attributes": {},
+            "description": description
+        }
+        self._data["aliases"].append(new_alias)
+        self._aliases_by_name[alias_name] = new_alias
+        return False
+
+    def flush(self) -> None:
+        """Write pending registrations back to the definitions file."""
+        if self._data is None:
+            return
+
+        # Write back to file with pretty formatting
+        write_json(self.definitions_path, self._data)
+        self._data = None
+        self._aliases_by_name = {}
+
+
+_alias_registry = _AliasRegistry(
+    Path(__file__).parent.parent / "src" / "jinja_roos_components" / "overall_definitions.json"
+)
+
+
+def batch_alias_registration():
+    """Collect alias registrations of several conversions into one file write.
+
+    Use as ``with batch_alias_registration(): ...`` around a series of
+    ComponentConverter.convert() calls.
+    """
+    return _alias_registry.batch()
+
+
 class ComponentConverter:
     """Converter for React components to Jinja templates."""
 
@@ -72,11 +212,12 @@ class ComponentConverter:
         self.jsx_structure_parser = JsxStructureParser()
         self.nested_component_detector = NestedComponentDetector()
         self.array_shape_analyzer = ArrayShapeAnalyzer()
-        self.customization_loader = CustomizationLoader()
+        self.customization_loader = get_default_loader()
         self.jinja_generator = JinjaGenerator(self.output_name)
         self.definition_generator = DefinitionGenerator(self.output_name)
         self.manual_review_items = []
         self.add_children_support = False  # Track if children support is enabled
+        self._source_cache: Dict[str, str] = {}  # TSX contents by path, see _read_source
 
     def convert(self) -> None:
         """Run the full conversion process."""
@@ -443,6 +584,7 @@ class ComponentConverter:
         # If a source file was explicitly provided, use it
         if self.source_file_override:
             tsx_file = Path(self.source_file_override)
+            # Checked directly: an override may point outside the cached RVO tree
             if not tsx_file.exists():
                 raise FileNotFoundError(f"Template file not found: {tsx_file}")
 
@@ -457,16 +599,17 @@ class ComponentConverter:
         rvo_dir = get_rvo_components_dir()
         component_dir = rvo_dir / self.component_name
 
-        if not component_dir.exists():
+        if self.component_name not in list_dir_names(rvo_dir):
             raise FileNotFoundError(f"Component directory not found: {component_dir}")
 
+        src_names = list_dir_names(component_dir / "src")
         tsx_file = component_dir / "src" / "template.tsx"
-        if not tsx_file.exists():
+        if "template.tsx" not in src_names:
             raise FileNotFoundError(f"Template file not found: {tsx_file}")
 
-        defaultargs_file = component_dir / "src" / "defaultArgs.ts"
-        if not defaultargs_file.exists():
-            defaultargs_file = None
+        defaultargs_file = None
+        if "defaultArgs.ts" in src_names:
+            defaultargs_file = component_dir / "src" / "defaultArgs.ts"
 
         return str(tsx_file), str(defaultargs_file) if defaultargs_file else None
 
@@ -506,15 +649,9 @@ class ComponentConverter:
         if not candidate_components:
             return []
 
-        # Find the root component by looking for the first opening tag in JSX
-        jsx_content = component_info.jsx_content.strip()
-        # Skip opening parenthesis if present
-        if jsx_content.startswith('('):
-            jsx_content = jsx_content[1:].strip()
-
-        # Find first component tag: <ComponentName
-        import re
-        match = re.match(r'<([A-Z][A-Za-z0-9]*)', jsx_content)
+        # Find the root component by looking for the first opening tag in JSX:
+        # <ComponentName (skipping leading whitespace and an opening parenthesis)
+        match = _ROOT_TAG_RE.match(component_info.jsx_content)
         if not match:
             # No component found, return all candidates
             return candidate_components
@@ -540,6 +677,10 @@ class ComponentConverter:
         Returns:
             List of nested component metadata
         """
+        # Leaf components render only HTML elements - nothing to detect
+        if not _HAS_COMPONENT_TAG_RE.search(component_info.jsx_content):
+            return []
+
         return self.nested_component_detector.detect_nested_components(
             component_info.imports,
             component_info.jsx_content,
@@ -553,7 +694,8 @@ class ComponentConverter:
             nested_components: List of nested component metadata
         """
         for nested_comp in nested_components:
-            # Check if template already exists
+            # Check if template already exists (not cached: earlier
+            # nested conversions write into this directory)
             output_file = get_output_template_dir() / f"{nested_comp['name']}.html.j2"
 
             if not output_file.exists():
@@ -562,7 +704,7 @@ class ComponentConverter:
                 # Use the resolved path if available, otherwise fall back to extracting from source_path
                 resolved_path = nested_comp.get('resolved_path')
 
-                if resolved_path and file_exists(resolved_path):
+                if resolved_path and Path(resolved_path).name in list_dir_names(Path(resolved_path).parent):
                     # Use full path directly
                     try:
                         print(f"      → Starting conversion using: {resolved_path}")
@@ -606,41 +748,38 @@ class ComponentConverter:
         # Merge default_args and example_values to find all arrays
         all_defaults = {**component_info.default_args, **component_info.example_values}
 
+        # Collect string references like "defaultSteps" up front so the
+        # defaultArgs file is only read when there is something to resolve
+        refs = [
+            (key, value) for key, value in all_defaults.items()
+            if isinstance(value, str) and value.startswith('default')
+        ]
+
         # If we have string references like "defaultSteps", try to resolve them
-        if defaultargs_file and file_exists(defaultargs_file):
+        if refs and defaultargs_file and file_exists(defaultargs_file):
             defaults_content = read_file(defaultargs_file)
-            for key, value in list(all_defaults.items()):
-                if isinstance(value, str) and value.startswith('default'):
-                    # Try to extract the actual array from the file
-                    # Pattern: export const defaultSteps = [...]
-                    import re
-                    pattern = rf'export\s+const\s+{value}\s*=\s*(\[[\s\S]*?\]);'
-                    match = re.search(pattern, defaults_content)
-                    if match:
+            for key, value in refs:
+                # Try to extract the actual array from the file
+                # Pattern: export const defaultSteps = [...]
+                pattern = rf'export\s+const\s+{value}\s*=\s*(\[[\s\S]*?\]);'
+                match = re.search(pattern, defaults_content)
+                if match:
+                    try:
+                        # Quote keys, normalize string quotes and drop
+                        # `as const` / trailing commas (not allowed in JSON)
+                        array_str = _ts_to_json(match.group(1))
+                        # Try to parse as JSON
                         try:
-                            import json
-                            array_str = match.group(1)
-                            # Replace TypeScript syntax
-                            array_str = re.sub(r'\s+as\s+const', '', array_str)
-                            # Remove trailing commas (not allowed in JSON)
-                            array_str = re.sub(r',\s*([}\]])', r'\1', array_str)
-                            # Quote object keys for JSON compatibility
-                            # Pattern: word followed by colon (but not inside strings)
-                            array_str = re.sub(r'(\w+):', r'"\1":', array_str)
-                            # Replace single quotes with double quotes
-                            array_str = array_str.replace("'", '"')
-                            # Try to parse as JSON
-                            try:
-                                parsed = json.loads(array_str)
-                                all_defaults[key] = parsed
-                                print(f"   📖 Resolved {value} → array with {len(parsed)} items")
-                            except Exception as e:
-                                # If JSON parsing fails, keep the reference
-                                print(f"   ⚠ Failed to parse {value}: {str(e)[:50]}")
-                                pass
+                            parsed = json.loads(array_str)
+                            all_defaults[key] = parsed
+                            print(f"   📖 Resolved {value} → array with {len(parsed)} items")
                         except Exception as e:
-                            print(f"   ⚠ Error resolving {value}: {str(e)[:50]}")
+                            # If JSON parsing fails, keep the reference
+                            print(f"   ⚠ Failed to parse {value}: {str(e)[:50]}")
                             pass
+                    except Exception as e:
+                        print(f"   ⚠ Error resolving {value}: {str(e)[:50]}")
+                        pass
 
         return self.array_shape_analyzer.analyze_arrays(
             all_defaults,
@@ -657,8 +796,6 @@ class ComponentConverter:
         Returns:
             Dictionary of prop names to values
         """
-        import re
-
         jsx_name = base_component['jsx_name']
         jsx_content = component_info.jsx_content
 
@@ -902,6 +1039,23 @@ class ComponentConverter:
 
         return resolution['html_tag'], resolution['css_classes'], resolution.get('wrapper')
 
+    def _read_source(self, file_path: str) -> str:
+        """Read a component source file, once per conversion.
+
+        Several steps (clsx, switch, content and definition extraction) need the
+        full TSX source; they share a single read.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            File contents as string
+        """
+        content = self._source_cache.get(file_path)
+        if content is None:
+            content = self._source_cache[file_path] = read_file(file_path)
+        return content
+
     def _extract_clsx_mappings(self, component_info):
         """Extract class mappings from clsx() calls.
 
@@ -912,7 +1066,9 @@ class ComponentConverter:
             List of ClassMapping objects
         """
         # Read full source file to find clsx calls (they may be outside JSX)
-        source_content = read_file(component_info.file_path)
+        source_content = self._read_source(component_info.file_path)
+        if not _HAS_CLSX_RE.search(source_content):
+            return []
         return self.clsx_parser.extract_from_jsx(source_content)
 
     def _extract_raw_switch_mappings(self, component_info):
@@ -924,7 +1080,7 @@ class ComponentConverter:
         Returns:
             List of SwitchMapping objects
         """
-        source_content = read_file(component_info.file_path)
+        source_content = self._read_source(component_info.file_path)
         return self.switch_parser.extract_from_source(source_content)
 
     def _extract_switch_mappings(self, component_info, base_components, base_classes):
@@ -939,7 +1095,7 @@ class ComponentConverter:
             List of ClassMapping objects
         """
         # Read the full source file (not just JSX)
-        source_content = read_file(component_info.file_path)
+        source_content = self._read_source(component_info.file_path)
 
         # Extract switch mappings
         switch_mappings = self.switch_parser.extract_from_source(source_content)
@@ -991,79 +1147,90 @@ class ComponentConverter:
             class_mappings: Extracted class mappings from clsx
             switch_mappings: Optional raw switch mappings for computed variables
         """
+        class_builder = self.jinja_generator.class_builder
+
         # Add base classes to Jinja generator
-        self.jinja_generator.class_builder.add_base_classes(base_classes)
+        class_builder.add_base_classes(base_classes)
 
         # Add switch mappings as computed variables
         if switch_mappings:
             for switch_mapping in switch_mappings:
                 # Generate Jinja if/elif chain for switch
                 jinja_expr = self._switch_to_jinja_expr(switch_mapping)
-                self.jinja_generator.class_builder.add_computed_var(
+                class_builder.add_computed_var(
                     switch_mapping.result_var,
                     jinja_expr
                 )
 
-        # Add conditional classes from clsx mappings
-        for mapping in class_mappings:
-            # Handle special template markers
-            if mapping.value == '__TEMPLATE__':
-                # Template literal class
-                condition = mapping.condition if mapping.condition != '__ALWAYS__' else None
-                self.jinja_generator.class_builder.add_template_class(
-                    mapping.css_class,
-                    condition
-                )
-            elif mapping.prop_name == '__COMPOUND__':
-                # Compound condition like "type === 'unordered' && noMargin"
-                # Convert React syntax to Jinja syntax
-                jinja_condition = self._convert_react_condition_to_jinja(mapping.condition)
-                self.jinja_generator.class_builder.add_conditional_class(
-                    mapping.css_class,
-                    jinja_condition
-                )
-            elif mapping.prop_name == '__JINJA__':
-                # Custom CSS class mapping from customization - condition is already in Jinja format
-                self.jinja_generator.class_builder.add_conditional_class(
-                    mapping.css_class,
-                    mapping.condition
-                )
-            elif mapping.prop_name == '__TERNARY__':
-                # Ternary expression in template - needs special handling
-                # For now, add as template class
-                self.jinja_generator.class_builder.add_template_class(
-                    mapping.css_class,
-                    None  # Always include, but has ternary inside
-                )
-            elif mapping.value == 'true':
-                # Boolean prop
-                self.jinja_generator.class_builder.add_boolean_class(
-                    mapping.prop_name,
-                    mapping.css_class
-                )
-            elif mapping.value == 'false':
-                # Negated boolean prop
-                self.jinja_generator.class_builder.add_boolean_class(
-                    mapping.prop_name,
+        # Bind builder methods once; the handlers below run per clsx mapping
+        add_template_class = class_builder.add_template_class
+        add_conditional_class = class_builder.add_conditional_class
+        add_boolean_class = class_builder.add_boolean_class
+        convert_condition = self._convert_react_condition_to_jinja
+
+        def add_template(mapping):
+            # Template literal class
+            condition = mapping.condition if mapping.condition != '__ALWAYS__' else None
+            add_template_class(mapping.css_class, condition)
+
+        def add_compound(mapping):
+            # Compound condition like "type === 'unordered' && noMargin"
+            # Convert React syntax to Jinja syntax
+            add_conditional_class(mapping.css_class, convert_condition(mapping.condition))
+
+        def add_jinja(mapping):
+            # Custom CSS class mapping from customization - condition is already in Jinja format
+            add_conditional_class(mapping.css_class, mapping.condition)
+
+        def add_ternary(mapping):
+            # Ternary expression in template - needs special handling
+            # For now, add as template class
+            add_template_class(
+                mapping.css_class,
+                None  # Always include, but has ternary inside
+            )
+
+        def add_boolean(mapping):
+            # Boolean prop
+            add_boolean_class(mapping.prop_name, mapping.css_class)
+
+        def add_negated_boolean(mapping):
+            # Negated boolean prop
+            add_boolean_class(mapping.prop_name, mapping.css_class, negate=True)
+
+        def add_enum(mapping):
+            # Value-based (enum)
+            # Check if this mapping has a compound condition (preserved from template expansion)
+            if mapping.condition and ' && ' in mapping.condition:
+                # Use the compound condition (convert React syntax to Jinja)
+                add_conditional_class(mapping.css_class, convert_condition(mapping.condition))
+            else:
+                # Simple enum condition
+                add_conditional_class(
                     mapping.css_class,
-                    negate=True
+                    f"{mapping.prop_name} == '{mapping.value}'"
                 )
-            else:
-                # Value-based (enum)
-                # Check if this mapping has a compound condition (preserved from template expansion)
-                if mapping.condition and ' && ' in mapping.condition:
-                    # Use the compound condition (convert React syntax to Jinja)
-                    jinja_condition = self._convert_react_condition_to_jinja(mapping.condition)
-                    self.jinja_generator.class_builder.add_conditional_class(
-                        mapping.css_class,
-                        jinja_condition
-                    )
-                else:
-                    # Simple enum condition
-                    self.jinja_generator.class_builder.add_conditional_class(
-                        mapping.css_class,
-                        f"{mapping.prop_name} == '{mapping.value}'"
-                    )
+
+        # Special markers live either in prop_name or in value; a '__TEMPLATE__'
+        # value takes precedence over prop markers, which take precedence over
+        # the boolean values
+        prop_handlers = {
+            '__COMPOUND__': add_compound,
+            '__JINJA__': add_jinja,
+            '__TERNARY__': add_ternary,
+        }
+        value_handlers = {
+            '__TEMPLATE__': add_template,
+            'true': add_boolean,
+            'false': add_negated_boolean,
+        }
+
+        # Add conditional classes from clsx mappings
+        for mapping in class_mappings:
+            handler = prop_handlers.get(mapping.prop_name)
+            if handler is None or mapping.value == '__TEMPLATE__':
+                handler = value_handlers.get(mapping.value, add_enum)
+            handler(mapping)
 
     def _switch_to_jinja_expr(self, switch_mapping) -> str:
         """Convert a switch mapping to a Jinja inline if/else expression.
@@ -1091,23 +1258,25 @@ class ComponentConverter:
         # Start from the default case or empty string
         if default_case:
             # If result is a variable (not quoted), use it directly
-            if default_case.result.isidentifier():
+            if default_case.is_variable:
                 expr = default_case.result
             else:
                 expr = f"'{default_case.result}'"
         else:
             expr = "''"
 
-        # Work backwards through regular cases
-        for case in reversed(regular_cases):
-            # Build condition for this case
-            conditions = [f"{switch_mapping.switch_var} == '{val}'" for val in case.values]
-            condition = ' or '.join(conditions)
+        # Chain the regular cases in order; Jinja's inline if/else nests to the
+        # right, so "a if x else b if y else c" needs no parentheses
+        switch_var = switch_mapping.switch_var
+        parts = []
+        for case in regular_cases:
+            condition = ' or '.join(f"{switch_var} == {val!r}" for val in case.values)
+            # Variable results (`appearance = kind;`) are referenced, not quoted
+            result = case.result if case.is_variable else f"'{case.result}'"
+            parts.append(f"{result} if {condition} else ")
+        parts.append(expr)
 
-            # Nest in ternary
-            expr = f"'{case.result}' if {condition} else {expr}"
-
-        return expr
+        return ''.join(parts)
 
     def _convert_react_condition_to_jinja(self, react_condition: str) -> str:
         """Convert React condition syntax to Jinja syntax.
@@ -1124,17 +1293,14 @@ class ComponentConverter:
         Returns:
             Jinja condition like "type == 'unordered' and noMargin"
         """
-        jinja_condition = react_condition
-
-        # Replace comparison operators
-        jinja_condition = jinja_condition.replace(' === ', ' == ')
-        jinja_condition = jinja_condition.replace(' !== ', ' != ')
-
-        # Replace logical operators
-        jinja_condition = jinja_condition.replace(' && ', ' and ')
-        jinja_condition = jinja_condition.replace(' || ', ' or ')
-
-        return jinja_condition
+        # Chained str.replace beats a regex pass on conditions this short
+        return (
+            react_condition
+            .replace(' === ', ' == ')
+            .replace(' !== ', ' != ')
+            .replace(' && ', ' and ')
+            .replace(' || ', ' or ')
+        )
 
     def _extract_content(self, component_info, tsx_file: str):
         """Extract content rendering logic from component.
@@ -1149,9 +1315,20 @@ class ComponentConverter:
         # Extract content elements from JSX
         content_elements = self.content_parser.extract_from_jsx(component_info.jsx_content)
 
+        # Only variables rendered as conditional/variable content can refer to
+        # a component assignment elsewhere in the source
+        referenced_vars = {
+            element.content for element in content_elements
+            if element.type in ('conditional', 'variable') and element.content
+        }
+        if not referenced_vars:
+            return content_elements
+
         # Read full source to resolve component references
-        source_content = read_file(tsx_file)
-        component_refs = self.content_parser.resolve_component_references(source_content)
+        source_content = self._read_source(tsx_file)
+        component_refs = self.content_parser.resolve_component_references(
+            source_content, referenced_vars
+        )
 
         # Attach component reference info to elements
         for element in content_elements:
@@ -1241,7 +1418,7 @@ class ComponentConverter:
         Returns:
             Definition dictionary
         """
-        source_content = read_file(source_file)
+        source_content = self._read_source(source_file)
 
         return self.definition_generator.generate_definition(
             component_info.props_interface or [],
@@ -1271,45 +1448,17 @@ class ComponentConverter:
         return max(percentage, 50.0)
 
     def _register_aliases(self) -> None:
-        """Register component aliases in overall_definitions.json."""
-        import json
-        from pathlib import Path
-
-        # Get path to main overall_definitions.json in src/jinja_roos_components
-        definitions_path = Path(__file__).parent.parent / "src" / "jinja_roos_components" / "overall_definitions.json"
-
-        # Load existing definitions
-        with open(definitions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """Register component aliases in overall_definitions.json.
 
-        # Ensure aliases array exists
-        if "aliases" not in data:
-            data["aliases"] = []
-
-        # Add each alias
+        Inside batch_alias_registration() the file is written once, when the
+        batch ends.
+        """
         for alias_name in self.aliases:
-            # Check if alias already exists
-            existing_alias = next((a for a in data["aliases"] if a["name"] == alias_name), None)
-
-            if existing_alias:
-                # Update existing alias to point to new target
-                existing_alias["target_component"] = self.output_name
-                existing_alias["description"] = f"Alias for {self.output_name}"
+            if _alias_registry.queue(alias_name, self.output_name):
                 print(f"   ⚠ Updated existing alias: {alias_name}")
-            else:
-                # Add new alias
-                new_alias = {
-                    "name": alias_name,
-                    "target_component": self.output_name,
-                    "default_attributes": {},
-                    "description": f"Alias for {self.output_name}"
-                }
-                data["aliases"].append(new_alias)
 
-        # Write back to file with pretty formatting
-        with open(definitions_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        if not _alias_registry.batching:
+            _alias_registry.flush()
 
 
 def main():
@@ -1360,7 +1509,9 @@ Examples:
             output_name=args.output_name,
             aliases=args.aliases
         )
-        converter.convert()
+        # Nested component conversions register their aliases too
+        with batch_alias_registration():
+            converter.convert()
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
         if args.verbose:
@@ -1,5 +1,5 @@
 """Component customizations for conversion."""
 
-from .customization_loader import CustomizationLoader
+from .customization_loader import CustomizationLoader, get_default_loader
 
-__all__ = ['CustomizationLoader']
+__all__ = ['CustomizationLoader', 'get_default_loader']
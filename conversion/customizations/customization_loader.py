@@ -2,6 +2,7 @@
 
 import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -20,7 +21,9 @@ class CustomizationLoader:
     def __init__(self):
         self.customizations_dir = Path(__file__).parent
         self.tokens = self._load_tokens()
-        self._token_cache = {}
+        self._token_cache = self._resolve_tokens()
+        # Parsed {component}.json per component name (None when absent)
+        self._customization_cache: Dict[str, Optional[Dict]] = {}
 
     def _load_tokens(self) -> Dict:
         """Load token reference definitions."""
@@ -33,17 +36,74 @@ class CustomizationLoader:
 
     def has_customization(self, component_name: str) -> bool:
         """Check if a component has customizations."""
+        if component_name in self._customization_cache:
+            return self._customization_cache[component_name] is not None
+
         custom_file = self.customizations_dir / f"{component_name}.json"
         return custom_file.exists()
 
     def load_customization(self, component_name: str) -> Optional[Dict]:
-        """Load customization for a component."""
+        """Load customization for a component.
+
+        The parsed file is cached per component name, as every accessor below
+        goes through here several times per conversion. Callers must treat the
+        returned dict as read-only.
+        """
+        if component_name in self._customization_cache:
+            return self._customization_cache[component_name]
+
         custom_file = self.customizations_dir / f"{component_name}.json"
-        if not custom_file.exists():
-            return None
+        customization = None
+        if custom_file.exists():
+            with open(custom_file, 'r', encoding='utf-8') as f:
+                customization = json.load(f)
 
-        with open(custom_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self._customization_cache[component_name] = customization
+        return customization
+
+    def _customization_value(self, component_name: str, key: str, default: Any = None) -> Any:
+        """Read a single top-level key from a component's cached customization.
+
+        Args:
+            component_name: Name of the component
+            key: Customization key to read
+            default: Value returned when there is no customization or no such key
+
+        Returns:
+            The stored value or default
+        """
+        customization = self.load_customization(component_name)
+        if not customization:
+            return default
+        return customization.get(key, default)
+
+    def _resolve_tokens(self) -> Dict[str, List[str]]:
+        """Resolve every token definition in _tokens.json up front.
+
+        Keys starting with an underscore (``_description``, ``_sources``) are
+        file metadata, not token definitions, and are skipped.
+
+        Returns:
+            Dictionary mapping token reference names to their values
+        """
+        resolved = {}
+        for reference, token_def in self.tokens.items():
+            if reference.startswith('_'):
+                continue
+
+            if token_def['type'] == 'static':
+                # Static list of values
+                resolved[reference] = token_def['values']
+            elif token_def['type'] == 'reference':
+                # Extract from source
+                resolved[reference] = self._extract_from_source(
+                    token_def['source'],
+                    token_def['extract_field']
+                )
+            else:
+                raise ValueError(f"Unknown token type: {token_def['type']}")
+
+        return resolved
 
     def resolve_token_reference(self, reference: str) -> List[str]:
         """Resolve a token reference like 'all_rvo_colors' to actual values.
@@ -54,30 +114,10 @@ class CustomizationLoader:
         Returns:
             List of actual values
         """
-        # Check cache first
-        if reference in self._token_cache:
+        try:
             return self._token_cache[reference]
-
-        # Get token definition
-        token_def = self.tokens.get(reference)
-        if not token_def:
-            raise ValueError(f"Unknown token reference: {reference}")
-
-        if token_def['type'] == 'static':
-            # Static list of values
-            values = token_def['values']
-        elif token_def['type'] == 'reference':
-            # Extract from source
-            values = self._extract_from_source(
-                token_def['source'],
-                token_def['extract_field']
-            )
-        else:
-            raise ValueError(f"Unknown token type: {token_def['type']}")
-
-        # Cache for future use
-        self._token_cache[reference] = values
-        return values
+        except KeyError:
+            raise ValueError(f"Unknown token reference: {reference}") from None
 
     def _extract_from_source(self, source_function: str, extract_field: str) -> List[str]:
         """Extract values from a source function.
@@ -106,8 +146,12 @@ class CustomizationLoader:
         if not data and source_function == 'extract_colors_from_tokens':
             data = self._extract_colors_from_definitions()
 
-        # Extract the specified field
-        return [item[extract_field] for item in data if extract_field in item]
+        # Extract the specified field; extractor output normally has it on
+        # every item, so only filter when that turns out not to be the case
+        try:
+            return list(map(itemgetter(extract_field), data))
+        except KeyError:
+            return [item[extract_field] for item in data if extract_field in item]
 
     def _extract_colors_from_definitions(self) -> List[Dict[str, str]]:
         """Fallback: Extract colors from overall_definitions.json if token extraction fails.
@@ -179,9 +223,10 @@ class CustomizationLoader:
             # Import here to avoid circular dependency
             from conversion.parsers.interface_parser import AttributeInfo
 
+            existing_names = {a.name for a in attributes}
             for attr_name, attr_def in attribute_additions.items():
                 # Check if it already exists
-                if any(a.name == attr_name for a in attributes):
+                if attr_name in existing_names:
                     continue
 
                 # Create new attribute
@@ -204,6 +249,7 @@ class CustomizationLoader:
                         new_attr.enum_values = attr_def['values']
 
                 attributes.append(new_attr)
+                existing_names.add(attr_name)
 
         return attributes
 
@@ -216,11 +262,7 @@ class CustomizationLoader:
         Returns:
             List of note strings
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return []
-
-        notes = customization.get('notes', [])
+        notes = self._customization_value(component_name, 'notes', [])
         if isinstance(notes, str):
             return [notes]
         return notes
@@ -234,11 +276,7 @@ class CustomizationLoader:
         Returns:
             List of alias strings (empty list if no aliases defined)
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return []
-
-        aliases = customization.get('aliases', [])
+        aliases = self._customization_value(component_name, 'aliases', [])
         # Support both string and list formats
         if isinstance(aliases, str):
             return [aliases]
@@ -254,12 +292,7 @@ class CustomizationLoader:
         Returns:
             Modified default args
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return default_args
-
-        # Get default overrides
-        default_overrides = customization.get('default_overrides', {})
+        default_overrides = self._customization_value(component_name, 'default_overrides', {})
         if not default_overrides:
             return default_args
 
@@ -281,11 +314,7 @@ class CustomizationLoader:
         Returns:
             Dict with children support config or None
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return None
-
-        return customization.get('add_children_support')
+        return self._customization_value(component_name, 'add_children_support')
 
     def get_pass_through_attributes(self, component_name: str) -> List[Dict[str, Any]]:
         """Get pass-through attributes from customization.
@@ -299,11 +328,7 @@ class CustomizationLoader:
         Returns:
             List of pass-through attribute definitions
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return []
-
-        return customization.get('pass_through_attributes', [])
+        return self._customization_value(component_name, 'pass_through_attributes', [])
 
     def get_custom_content_template(self, component_name: str) -> Optional[str]:
         """Get custom content template from customization.
@@ -316,11 +341,7 @@ class CustomizationLoader:
         Returns:
             Custom content template string or None
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return None
-
-        return customization.get('custom_content_template')
+        return self._customization_value(component_name, 'custom_content_template')
 
     def get_css_class_mappings(self, component_name: str) -> List[Dict[str, str]]:
         """Get custom CSS class mappings from customization.
@@ -334,8 +355,23 @@ class CustomizationLoader:
         Returns:
             List of mappings with 'class' and 'condition' keys
         """
-        customization = self.load_customization(component_name)
-        if not customization:
-            return []
+        return self._customization_value(component_name, 'css_class_mappings', [])
+
+
+_default_loader: Optional[CustomizationLoader] = None
+
+
+def get_default_loader() -> CustomizationLoader:
+    """Return the process-wide CustomizationLoader.
+
+    Sharing one loader lets every converter in a run (including nested
+    component conversions) reuse the resolved design tokens and parsed
+    customization files.
 
-        return customization.get('css_class_mappings', [])
+    Returns:
+        The shared CustomizationLoader instance
+    """
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = CustomizationLoader()
+    return _default_loader
@@ -1,16 +1,249 @@
 """Build CSS class logic for Jinja templates."""
 
-from typing import List, Dict, Any, Optional
+import ast
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import groupby
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ClassConditional:
+    """A CSS class applied when a Jinja condition holds."""
+    class_name: str
+    condition: str  # Jinja condition (e.g., "kind == 'primary'")
+
+
+@lru_cache(maxsize=128)
+def _name_mapping_pattern(originals: Tuple[str, ...]) -> re.Pattern:
+    """Compile one whole-word pattern matching any of the original names.
+
+    Longer names come first in the alternation so they win over prefixes.
+
+    Args:
+        originals: Original (unsafe) variable names
+
+    Returns:
+        Compiled pattern
+    """
+    alternation = '|'.join(re.escape(name) for name in sorted(originals, key=len, reverse=True))
+    return re.compile(rf'\b(?:{alternation})\b')
+
+
+def _name_mapper(name_mappings: dict) -> Callable[[str], str]:
+    """Resolve name mappings once into a text -> text function.
+
+    Args:
+        name_mappings: Dict mapping original names to safe names
+
+    Returns:
+        Function applying the mappings (identity when there are none)
+    """
+    if not name_mappings:
+        return lambda text: text
+    pattern = _name_mapping_pattern(tuple(name_mappings))
+    return partial(pattern.sub, lambda match: name_mappings[match.group(0)])
+
+
+@lru_cache(maxsize=32)
+def _size_entries(var_name: str, prefix: str, suffix: str) -> Tuple[ClassConditional, ...]:
+    """Build the conditional classes for the common sizes.
+
+    Args:
+        var_name: Size variable name
+        prefix: Class name prefix
+        suffix: Class name suffix
+
+    Returns:
+        Conditionals with interned strings, smallest size first
+    """
+    return tuple(
+        ClassConditional(sys.intern(f"{prefix}{size}{suffix}".strip('-')), sys.intern(f"{var_name} == '{size}'"))
+        for size in ('xs', 'sm', 'md', 'lg', 'xl')
+    )
+
+
+# Jinja literals that are spelled differently in Python
+_JINJA_CONSTANTS = {'true': True, 'false': False, 'none': None}
+
+
+class _ContextLookups(ast.NodeTransformer):
+    """Rewrite bare names in an expression to lookups in the variables dict ``v``."""
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id in _JINJA_CONSTANTS:
+            return ast.copy_location(ast.Constant(_JINJA_CONSTANTS[node.id]), node)
+        lookup = ast.Call(
+            func=ast.Attribute(value=ast.Name('v', ast.Load()), attr='get', ctx=ast.Load()),
+            args=[ast.Constant(node.id)],
+            keywords=[],
+        )
+        return ast.copy_location(lookup, node)
+
+
+# Marks an expression node that is not a literal
+_NOT_CONSTANT = object()
+
+
+def _constant(node: ast.expr) -> Any:
+    """Get the literal value of an expression node.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        The literal value, or _NOT_CONSTANT
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in _JINJA_CONSTANTS:
+        return _JINJA_CONSTANTS[node.id]
+    if (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+            and isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, (int, float))):
+        return -node.operand.value
+    return _NOT_CONSTANT
+
+
+def _is_literal(node: ast.expr) -> bool:
+    """Check for a literal other than none, which Jinja's undefined does not equal.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        True if node is a literal that is not None
+    """
+    value = _constant(node)
+    return value is not _NOT_CONSTANT and value is not None
+
+
+def _is_operand(node: ast.expr) -> bool:
+    """Check for a plain variable or literal.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        True if node is a variable name or a literal
+    """
+    return isinstance(node, ast.Name) or _constant(node) is not _NOT_CONSTANT
+
+
+def _is_safe_condition(node: ast.expr) -> bool:
+    """Check that a condition has the same truth value in Python and Jinja.
+
+    Unset variables are None in the Python version and undefined in Jinja.
+    Both are falsy, and neither equals a literal, so plain names, boolean
+    operators and comparisons against literals agree. Jinja tests
+    (``is defined``), attribute access and the like do not.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        True if the condition can be compiled to Python
+    """
+    if isinstance(node, ast.BoolOp):
+        return all(map(_is_safe_condition, node.values))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _is_safe_condition(node.operand)
+    if isinstance(node, ast.IfExp):
+        return all(map(_is_safe_condition, (node.test, node.body, node.orelse)))
+    if isinstance(node, ast.Compare):
+        if len(node.ops) != 1:
+            return False
+        op, left, right = node.ops[0], node.left, node.comparators[0]
+        if isinstance(op, (ast.Eq, ast.NotEq)):
+            return (_is_operand(left) and _is_literal(right)) or (_is_literal(left) and _is_operand(right))
+        if isinstance(op, (ast.In, ast.NotIn)):
+            return (_is_operand(left) and isinstance(right, (ast.List, ast.Tuple))
+                    and all(map(_is_literal, right.elts)))
+        return False
+    return _is_operand(node)
+
+
+def _is_safe_value(node: ast.expr) -> bool:
+    """Check that a class name expression gives the same string in Python and Jinja.
+
+    Variables are not allowed: an unset one renders as '' in Jinja but is
+    None in Python, and concatenating None raises.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        True if the value can be compiled to Python
+    """
+    if isinstance(node, ast.IfExp):
+        return _is_safe_condition(node.test) and _is_safe_value(node.body) and _is_safe_value(node.orelse)
+    if isinstance(node, ast.BinOp):
+        return isinstance(node.op, ast.Add) and _is_literal(node.left) and _is_literal(node.right)
+    return _is_literal(node)
+
+
+def _jinja_expr_to_python(expr: str, value: bool = False) -> str:
+    """Translate a Jinja expression to Python reading from the variables dict ``v``.
+
+    Args:
+        expr: Jinja expression (e.g., "kind == 'primary' and not disabled")
+        value: True for a class name expression, False for a condition
+
+    Returns:
+        Equivalent Python expression source
+
+    Raises:
+        ValueError: If the expression may evaluate differently than in Jinja
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Cannot compile Jinja expression to Python: {expr}") from e
+
+    is_safe = _is_safe_value if value else _is_safe_condition
+    if not is_safe(tree.body):
+        raise ValueError(f"Cannot compile Jinja expression to Python: {expr}")
+
+    return ast.unparse(_ContextLookups().visit(tree).body)
+
+
+@lru_cache(maxsize=256)
+def _compile_class_list(source: str) -> Callable[[Dict[str, Any]], List[str]]:
+    """Compile generated class-list source into a function, once per distinct source.
+
+    Args:
+        source: Python source defining ``_class_list(ctx)``
+
+    Returns:
+        The compiled function
+    """
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<class_builder>', 'exec'), namespace)
+    return namespace['_class_list']
+
+
+# Enum-style condition: var == 'value'
+_ENUM_CONDITION_RE = re.compile(r"\s*(\w+)\s*==\s*['\"]([^'\"]*)['\"]\s*")
+
+# Simple (non-nested) ternary: condition ? trueVal : falseVal
+_TERNARY_RE = re.compile(r'([^?]*)\?([^?:]*):([^?:]*)')
+
+# ${...} interpolation in a template literal class
+_TEMPLATE_EXPR_RE = re.compile(r'\$\{([^}]+)\}')
 
 
 class ClassBuilder:
     """Builder for CSS class conditionals in Jinja."""
 
     def __init__(self):
-        self.class_conditionals: List[str] = []
+        self.class_conditionals: List[ClassConditional] = []
+        self._conditional_seen: Set[ClassConditional] = set()  # Membership index for class_conditionals
         self.base_classes: List[str] = []
+        self._base_seen: Set[str] = set()  # Membership index for base_classes
         self.template_classes: List[Dict[str, Any]] = []  # Classes with variable interpolation
         self.computed_vars: List[Dict[str, str]] = []  # Computed variables (ternary, switch, etc.)
+        self._groups_cache: Optional[List[Dict[str, Any]]] = None  # See _group_conditionals
 
     def add_base_classes(self, classes: List[str]) -> None:
         """Add base CSS classes (always applied).
@@ -20,7 +253,9 @@ class ClassBuilder:
         """
         # Avoid duplicates
         for cls in classes:
-            if cls not in self.base_classes:
+            if cls not in self._base_seen:
+                cls = sys.intern(cls)
+                self._base_seen.add(cls)
                 self.base_classes.append(cls)
 
     def add_conditional_class(self, class_name: str, condition: str) -> None:
@@ -30,10 +265,16 @@ class ClassBuilder:
             class_name: CSS class name
             condition: Jinja condition (e.g., "kind == 'primary'")
         """
-        self.class_conditionals.append({
-            'class': class_name,
-            'condition': condition
-        })
+        # Class names and conditions recur across builders; share one object each
+        conditional = ClassConditional(sys.intern(class_name), sys.intern(condition))
+
+        # Identical pairs would only emit the same {% if %} block twice
+        if conditional in self._conditional_seen:
+            return
+        self._conditional_seen.add(conditional)
+
+        self.class_conditionals.append(conditional)
+        self._groups_cache = None
 
     def add_enum_classes(self, var_name: str, value_map: Dict[str, List[str]]) -> None:
         """Add classes based on enum values.
@@ -94,13 +335,14 @@ class ClassBuilder:
             prefix: Class name prefix
             suffix: Class name suffix
         """
-        # Common sizes
-        sizes = ['xs', 'sm', 'md', 'lg', 'xl']
+        entries = [conditional for conditional in _size_entries(var_name, prefix, suffix)
+                   if conditional not in self._conditional_seen]
+        if not entries:
+            return
 
-        for size in sizes:
-            class_name = f"{prefix}{size}{suffix}".strip('-')
-            condition = f"{var_name} == '{size}'"
-            self.add_conditional_class(class_name, condition)
+        self._conditional_seen.update(entries)
+        self.class_conditionals.extend(entries)
+        self._groups_cache = None
 
     def generate_jinja_code(self, array_var_name: str = 'css_classes', name_mappings: dict = None) -> str:
         """Generate Jinja template code for class building.
@@ -121,7 +363,7 @@ class ClassBuilder:
 
         # Initialize array with base classes
         if self.base_classes:
-            classes_str = ', '.join(f"'{c}'" for c in self.base_classes)
+            classes_str = ', '.join(map(repr, self.base_classes))
             lines.append(f"{{% set {array_var_name} = [{classes_str}] %}}")
         else:
             lines.append(f"{{% set {array_var_name} = [] %}}")
@@ -137,25 +379,157 @@ class ClassBuilder:
             if condition and condition != '__ALWAYS__':
                 # Convert React condition to Jinja
                 jinja_condition = self._convert_condition_to_jinja(condition, name_mappings)
-                lines.append(f"{{% if {jinja_condition} %}}")
-                lines.append(f"    {{% set {array_var_name} = {array_var_name} + [{jinja_class}] %}}")
-                lines.append("{% endif %}")
+                lines.extend([
+                    f"{{% if {jinja_condition} %}}",
+                    f"    {{% set {array_var_name} = {array_var_name} + [{jinja_class}] %}}",
+                    "{% endif %}",
+                ])
             else:
                 # Always include
                 lines.append(f"{{% set {array_var_name} = {array_var_name} + [{jinja_class}] %}}")
 
-        # Add conditional classes
-        for item in self.class_conditionals:
-            class_name = item['class']
-            condition = item['condition']
-            # Apply name mappings to condition
-            mapped_condition = self._apply_name_mappings(condition, name_mappings)
-            lines.append(
-                f"{{% if {mapped_condition} %}}{{% set {array_var_name} = {array_var_name} + ['{class_name}'] %}}{{% endif %}}"
-            )
+        # Add conditional classes (conditions get name mappings applied)
+        map_names = _name_mapper(name_mappings)
+        append_open = f"{{% set {array_var_name} = {array_var_name} + ["
+        lines.extend(
+            f"{{% if {map_names(item.condition)} %}}"
+            f"{append_open}{item.class_name!r}] %}}{{% endif %}}"
+            for item in self.class_conditionals
+        )
 
         return '\n'.join(lines)
 
+    def generate_jinja_code_fused(self, array_var_name: str = 'css_classes', name_mappings: dict = None) -> str:
+        """Generate Jinja code that builds the class list in a single assignment.
+
+        Builds the same classes in the same order as generate_jinja_code, but
+        instead of one ``{% if %}{% set %}`` per class the list is one
+        expression of conditional list parts, so Jinja builds it without
+        repeated copies. Consecutive enum conditionals on one variable are
+        folded into a single inline if/else chain.
+
+        Args:
+            array_var_name: Name of the Jinja array variable
+            name_mappings: Optional dict mapping original names to safe names (for reserved words)
+
+        Returns:
+            Jinja template code as string
+        """
+        name_mappings = name_mappings or {}
+        lines = [
+            f"{{% set {comp_var['name']} = {comp_var['expression']} %}}"
+            for comp_var in self.computed_vars
+        ]
+
+        classes_str = ', '.join(map(repr, self.base_classes))
+        parts = [f"[{classes_str}]"]
+
+        # Template classes (with variable interpolation)
+        for tpl_class in self.template_classes:
+            jinja_class = self._convert_template_to_jinja(tpl_class['template'], name_mappings)
+            condition = tpl_class['condition']
+            if condition and condition != '__ALWAYS__':
+                jinja_condition = self._convert_condition_to_jinja(condition, name_mappings)
+                parts.append(f"([{jinja_class}] if {jinja_condition} else [])")
+            else:
+                parts.append(f"[{jinja_class}]")
+
+        # Conditional classes in insertion order. Only runs of enum conditionals
+        # on the same variable are folded, so the class order is unchanged.
+        matches = [(item, _ENUM_CONDITION_RE.fullmatch(item.condition)) for item in self.class_conditionals]
+        for var_name, run in groupby(matches, key=lambda pair: pair[1] and pair[1].group(1)):
+            if var_name is None:
+                for item, _ in run:
+                    condition = self._apply_name_mappings(item.condition, name_mappings)
+                    parts.append(f"([{item.class_name!r}] if {condition} else [])")
+                continue
+
+            # value -> (condition, classes), in order of first appearance
+            branches: Dict[str, Tuple[str, List[str]]] = {}
+            for item, enum_match in run:
+                branches.setdefault(enum_match.group(2), (item.condition, []))[1].append(item.class_name)
+            chain = []
+            for condition, class_names in branches.values():
+                condition = self._apply_name_mappings(condition, name_mappings)
+                value_classes = ', '.join(map(repr, class_names))
+                chain.append(f"[{value_classes}] if {condition} else ")
+            parts.append(f"({''.join(chain)}[])")
+
+        lines.append(f"{{% set {array_var_name} = {' + '.join(parts)} %}}")
+        return '\n'.join(lines)
+
+    def compile_to_python(self, name_mappings: dict = None) -> Callable[[Dict[str, Any]], List[str]]:
+        """Compile the class logic to a Python function, bypassing Jinja.
+
+        The function takes the render context and returns the class list
+        that generate_jinja_code would build with Jinja's default undefined
+        handling. Only expressions that evaluate the same for unset and None
+        variables are compiled; builders using anything else (Jinja tests,
+        attribute access, variables in class names, ...) raise ValueError
+        and should go through generate_jinja_code. Compiled functions are
+        cached by their source, so builders with the same logic share one;
+        callers rendering often should keep the returned function.
+
+        Args:
+            name_mappings: Optional dict mapping original names to safe names (for reserved words)
+
+        Returns:
+            Function mapping a context dict to the list of CSS classes
+
+        Raises:
+            ValueError: If an expression may evaluate differently than in Jinja
+        """
+        name_mappings = name_mappings or {}
+        lines = [
+            "def _class_list(ctx):",
+            "    v = dict(ctx)",
+        ]
+
+        # Computed variables first, visible to everything after them. Only
+        # conditions read them, so they get the condition checks.
+        for comp_var in self.computed_vars:
+            expression = _jinja_expr_to_python(comp_var['expression'])
+            lines.append(f"    v[{comp_var['name']!r}] = {expression}")
+
+        lines.append(f"    r = {self.base_classes!r}")
+
+        # Template classes (with variable interpolation)
+        for tpl_class in self.template_classes:
+            expression = _jinja_expr_to_python(
+                self._convert_template_to_jinja(tpl_class['template'], name_mappings), value=True
+            )
+            condition = tpl_class['condition']
+            if condition and condition != '__ALWAYS__':
+                python_condition = _jinja_expr_to_python(self._convert_condition_to_jinja(condition, name_mappings))
+                lines.append(f"    if {python_condition}:")
+                lines.append(f"        r.append({expression})")
+            else:
+                lines.append(f"    r.append({expression})")
+
+        # Conditional classes
+        map_names = _name_mapper(name_mappings)
+        for item in self.class_conditionals:
+            lines.append(f"    if {_jinja_expr_to_python(map_names(item.condition))}:")
+            lines.append(f"        r.append({item.class_name!r})")
+
+        lines.append("    return r")
+        return _compile_class_list('\n'.join(lines))
+
+    def class_list(self, ctx: Dict[str, Any], name_mappings: dict = None) -> List[str]:
+        """Compute the CSS classes for a render context without going through Jinja.
+
+        Args:
+            ctx: Render context (template variables)
+            name_mappings: Optional dict mapping original names to safe names (for reserved words)
+
+        Returns:
+            List of CSS classes
+
+        Raises:
+            ValueError: If an expression may evaluate differently than in Jinja
+        """
+        return self.compile_to_python(name_mappings)(ctx)
+
     def _apply_name_mappings(self, text: str, name_mappings: dict) -> str:
         """Apply name mappings to variable names in text.
 
@@ -166,13 +540,12 @@ class ClassBuilder:
         Returns:
             Text with mapped variable names
         """
-        import re
-        result = text
-        # Sort by length descending to avoid partial matches
-        for original, mapped in sorted(name_mappings.items(), key=lambda x: len(x[0]), reverse=True):
-            # Match whole words only
-            result = re.sub(r'\b' + re.escape(original) + r'\b', mapped, result)
-        return result
+        if not name_mappings:
+            return text
+
+        # Match whole words only, all mappings in one pass
+        pattern = _name_mapping_pattern(tuple(name_mappings))
+        return pattern.sub(lambda match: name_mappings[match.group(0)], text)
 
     def _convert_template_to_jinja(self, template: str, name_mappings: dict = None) -> str:
         """Convert React template literal to Jinja string concatenation.
@@ -184,32 +557,16 @@ class ClassBuilder:
         Returns:
             Jinja expression like "'class--' + var"
         """
-        import re
         name_mappings = name_mappings or {}
 
-        # Find all ${...} expressions
+        # Split on ${...}: even indices are literals, odd ones expressions
         parts = []
-        last_end = 0
-
-        for match in re.finditer(r'\$\{([^}]+)\}', template):
-            # Add the literal part before this expression
-            if match.start() > last_end:
-                literal = template[last_end:match.start()]
-                if literal:
-                    parts.append(f"'{literal}'")
-
-            # Add the variable expression (convert ternary if needed)
-            var_expr = match.group(1)
-            converted_expr = self._convert_ternary_to_jinja(var_expr, name_mappings)
-            parts.append(converted_expr)
-
-            last_end = match.end()
-
-        # Add any remaining literal part
-        if last_end < len(template):
-            literal = template[last_end:]
-            if literal:
-                parts.append(f"'{literal}'")
+        for index, segment in enumerate(_TEMPLATE_EXPR_RE.split(template)):
+            if index % 2:
+                # Variable expression (convert ternary if needed)
+                parts.append(self._convert_ternary_to_jinja(segment, name_mappings))
+            elif segment:
+                parts.append(f"'{segment}'")
 
         # Join with +
         if len(parts) == 1:
@@ -227,10 +584,8 @@ class ClassBuilder:
             Jinja condition
         """
         name_mappings = name_mappings or {}
-        # Replace !== with !=
-        jinja_cond = condition.replace(' !== ', ' != ')
-        # Replace === with ==
-        jinja_cond = jinja_cond.replace(' === ', ' == ')
+        # Replace === with == and !== with != (faster than a regex on short conditions)
+        jinja_cond = condition.replace(' === ', ' == ').replace(' !== ', ' != ')
         # Apply name mappings
         jinja_cond = self._apply_name_mappings(jinja_cond, name_mappings)
         return jinja_cond
@@ -245,34 +600,27 @@ class ClassBuilder:
         Returns:
             Jinja expression like "('md' if line == 'substep-start' else size)"
         """
-        import re
         name_mappings = name_mappings or {}
 
         # Check if expression contains ternary operator
         if '?' not in expr or ':' not in expr:
             # No ternary, apply name mappings and return
-            return self._apply_name_mappings(expr, name_mappings)
+            return self._apply_name_mappings(expr, name_mappings) if name_mappings else expr
 
         # Parse ternary: condition ? trueVal : falseVal
-        # Split on ? first
-        parts = expr.split('?')
-        if len(parts) != 2:
+        ternary_match = _TERNARY_RE.fullmatch(expr)
+        if not ternary_match:
             return expr  # Invalid ternary, return as-is
 
-        condition = parts[0].strip()
-        value_parts = parts[1].split(':')
-        if len(value_parts) != 2:
-            return expr  # Invalid ternary, return as-is
-
-        true_val = value_parts[0].strip()
-        false_val = value_parts[1].strip()
+        condition, true_val, false_val = (part.strip() for part in ternary_match.groups())
 
         # Convert condition to Jinja syntax (with name mappings)
         jinja_condition = self._convert_condition_to_jinja(condition, name_mappings)
 
-        # Apply name mappings to values
-        true_val = self._apply_name_mappings(true_val, name_mappings)
-        false_val = self._apply_name_mappings(false_val, name_mappings)
+        # Apply name mappings to values (most components have none)
+        if name_mappings:
+            true_val = self._apply_name_mappings(true_val, name_mappings)
+            false_val = self._apply_name_mappings(false_val, name_mappings)
 
         # Handle !== by flipping the condition
         if ' !== ' in condition:
@@ -296,36 +644,32 @@ class ClassBuilder:
 
         # Base classes
         if self.base_classes:
-            classes_str = ', '.join(f"'{c}'" for c in self.base_classes)
+            classes_str = ', '.join(map(repr, self.base_classes))
             lines.append(f"{{% set {array_var_name} = [{classes_str}] %}}")
         else:
             lines.append(f"{{% set {array_var_name} = [] %}}")
 
         # Group conditionals by similar patterns
         grouped = self._group_conditionals()
+        append_open = f"{{% set {array_var_name} = {array_var_name} + ["
 
         for group in grouped:
             if group['type'] == 'single':
                 # Single conditional
                 item = group['items'][0]
                 lines.append(
-                    f"{{% if {item['condition']} %}}{{% set {array_var_name} = {array_var_name} + ['{item['class']}'] %}}{{% endif %}}"
+                    f"{{% if {item.condition} %}}{append_open}{item.class_name!r}] %}}{{% endif %}}"
                 )
             elif group['type'] == 'enum':
-                # Enum-based (if/elif chain)
+                # Enum-based (if/elif chain), one list append per value
                 var_name = group['var_name']
-                first = True
-                for item in group['items']:
-                    value = item['value']
-                    class_name = item['class']
-
-                    if first:
-                        lines.append(f"{{% if {var_name} == '{value}' %}}")
-                        first = False
-                    else:
-                        lines.append(f"{{% elif {var_name} == '{value}' %}}")
-
-                    lines.append(f"    {{% set {array_var_name} = {array_var_name} + ['{class_name}'] %}}")
+                keyword = 'if'
+                for value, class_names in group['items'].items():
+                    lines.append(
+                        f"{{% {keyword} {var_name} == '{value}' %}}\n"
+                        f"    {append_open}{', '.join(map(repr, class_names))}] %}}"
+                    )
+                    keyword = 'elif'
 
                 lines.append("{% endif %}")
 
@@ -334,27 +678,24 @@ class ClassBuilder:
     def _group_conditionals(self) -> List[Dict[str, Any]]:
         """Group conditionals by pattern for more compact output.
 
+        The grouping is cached until the conditionals change.
+
         Returns:
             List of grouped conditionals
         """
+        if self._groups_cache is not None:
+            return self._groups_cache
+
         groups = []
-        enum_groups: Dict[str, List[Dict]] = {}
+        # var_name -> value -> classes, in order of first appearance
+        enum_groups: Dict[str, Dict[str, List[str]]] = {}
 
         for item in self.class_conditionals:
-            condition = item['condition']
-
             # Check if it's an enum pattern (var == 'value')
-            if " == '" in condition and condition.count('==') == 1:
-                var_name = condition.split(" == ")[0].strip()
-                value = condition.split(" == ")[1].strip().strip("'\"")
-
-                if var_name not in enum_groups:
-                    enum_groups[var_name] = []
-
-                enum_groups[var_name].append({
-                    'value': value,
-                    'class': item['class']
-                })
+            enum_match = _ENUM_CONDITION_RE.fullmatch(item.condition)
+            if enum_match:
+                var_name, value = enum_match.groups()
+                enum_groups.setdefault(var_name, {}).setdefault(value, []).append(item.class_name)
             else:
                 # Single conditional
                 groups.append({
@@ -364,24 +705,30 @@ class ClassBuilder:
 
         # Add enum groups
         for var_name, items in enum_groups.items():
-            if len(items) > 1:
-                groups.append({
-                    'type': 'enum',
-                    'var_name': var_name,
-                    'items': items
-                })
-            else:
-                groups.append({
-                    'type': 'single',
-                    'items': [{
-                        'class': items[0]['class'],
-                        'condition': f"{var_name} == '{items[0]['value']}'"
-                    }]
-                })
-
+            if len(items) == 1:
+                (value, class_names), = items.items()
+                if len(class_names) == 1:
+                    groups.append({
+                        'type': 'single',
+                        'items': [ClassConditional(class_names[0], f"{var_name} == '{value}'")]
+                    })
+                    continue
+
+            groups.append({
+                'type': 'enum',
+                'var_name': var_name,
+                'items': items
+            })
+
+        self._groups_cache = groups
         return groups
 
     def reset(self) -> None:
         """Reset the builder state."""
         self.class_conditionals = []
+        self._conditional_seen = set()
         self.base_classes = []
+        self._base_seen = set()
+        self._groups_cache = None
+        self.template_classes = []
+        self.computed_vars = []
@@ -1,15 +1,71 @@
 """Generate component definition JSON files."""
 
-import json
-from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 from ..parsers.interface_parser import AttributeInfo
-from ..utils.file_helpers import compute_hash
+from ..utils.file_helpers import compute_hash, ensure_dir, write_json
+
+
+# TypeScript type -> definition type; anything else becomes 'string'
+_TYPE_MAP = {
+    'string': 'string',
+    'number': 'number',
+    'boolean': 'boolean',
+    'object': 'object',
+    'function': 'function'
+}
+
+
+@lru_cache(maxsize=128)
+def _primary_type(types: Tuple[str, ...]) -> str:
+    """Determine the definition type for a type signature.
+
+    Args:
+        types: Attribute types
+
+    Returns:
+        Primary type string
+    """
+    if 'enum' in types:
+        return 'enum'
+
+    # Filter out 'enum' and get first remaining type
+    other_types = [t for t in types if t != 'enum']
+
+    if not other_types:
+        return 'string'
+
+    # Map to definition type
+    return _TYPE_MAP.get(other_types[0], 'string')
+
+
+@lru_cache(maxsize=128)
+def _type_default(types: Tuple[str, ...], first_enum_value: Optional[str]) -> Any:
+    """Get the default value for a type signature.
+
+    Args:
+        types: Attribute types
+        first_enum_value: First enum value, if the attribute has any
+
+    Returns:
+        Default value
+    """
+    if 'boolean' in types:
+        return False
+    if 'number' in types:
+        return 0
+    if 'enum' in types and first_enum_value is not None:
+        return first_enum_value
+
+    return ""
 
 
 class DefinitionGenerator:
     """Generator for component definition JSON files."""
 
+    __slots__ = ('component_name',)
+
     def __init__(self, component_name: str):
         """Initialize generator.
 
@@ -79,14 +135,17 @@ class DefinitionGenerator:
         Returns:
             Relative path starting from 'rvo' folder
         """
-        # Find 'rvo' in the path and extract from there onwards
-        parts = source_file.split('/')
-        try:
-            rvo_index = parts.index('rvo')
-            return '/'.join(parts[rvo_index:])
-        except ValueError:
-            # If 'rvo' not found, return the full path as fallback
+        # Find the first 'rvo' path segment and extract from there onwards
+        if source_file.startswith('rvo/'):
             return source_file
+        rvo_index = source_file.find('/rvo/')
+        if rvo_index != -1:
+            return source_file[rvo_index + 1:]
+        # A path ending in the 'rvo' folder itself
+        if source_file == 'rvo' or source_file.endswith('/rvo'):
+            return source_file[source_file.rfind('rvo'):]
+        # If 'rvo' not found, return the full path as fallback
+        return source_file
 
     def _convert_attributes(
         self,
@@ -115,9 +174,12 @@ class DefinitionGenerator:
             if attr.is_function:
                 continue
 
+            # Attributes share a handful of type signatures; resolve each once
+            types = tuple(attr.types)
+
             attr_def = {
                 "name": attr.name,
-                "type": self._determine_primary_type(attr),
+                "type": _primary_type(types),
                 "required": attr.required,
                 "description": attr.description or f"{attr.name} attribute"
             }
@@ -141,7 +203,8 @@ class DefinitionGenerator:
                 attr_def["default"] = default_args[attr.name]
             elif not attr.required:
                 # Provide sensible defaults
-                attr_def["default"] = self._get_type_default(attr)
+                first_enum_value = attr.enum_values[0] if attr.enum_values else None
+                attr_def["default"] = _type_default(types, first_enum_value)
 
             # Mark as example if only in example values
             if attr.name in example_values:
@@ -152,55 +215,6 @@ class DefinitionGenerator:
 
         return result
 
-    def _determine_primary_type(self, attr: AttributeInfo) -> str:
-        """Determine primary type for attribute.
-
-        Args:
-            attr: Attribute info
-
-        Returns:
-            Primary type string
-        """
-        if 'enum' in attr.types:
-            return 'enum'
-
-        # Filter out 'enum' and get first remaining type
-        other_types = [t for t in attr.types if t != 'enum']
-
-        if not other_types:
-            return 'string'
-
-        primary_type = other_types[0]
-
-        # Map to definition type
-        type_map = {
-            'string': 'string',
-            'number': 'number',
-            'boolean': 'boolean',
-            'object': 'object',
-            'function': 'function'
-        }
-
-        return type_map.get(primary_type, 'string')
-
-    def _get_type_default(self, attr: AttributeInfo) -> Any:
-        """Get default value based on type.
-
-        Args:
-            attr: Attribute info
-
-        Returns:
-            Default value
-        """
-        if 'boolean' in attr.types:
-            return False
-        if 'number' in attr.types:
-            return 0
-        if 'enum' in attr.types and attr.enum_values:
-            return attr.enum_values[0]
-
-        return ""
-
     def write_definition(self, definition: Dict[str, Any], output_path: str) -> None:
         """Write definition to JSON file.
 
@@ -208,10 +222,8 @@ class DefinitionGenerator:
             definition: Definition dictionary
             output_path: Path to output file
         """
-        from ..utils.file_helpers import write_file
-
-        json_content = json.dumps(definition, indent=2, ensure_ascii=False)
-        write_file(output_path, json_content)
+        ensure_dir(Path(output_path).parent)
+        write_json(output_path, definition, trailing_newline=False)
 
     def generate_review_document(
         self,
@@ -227,38 +239,36 @@ class DefinitionGenerator:
         Returns:
             Markdown document as string
         """
-        lines = [
-            f"# {self.component_name.title()} Conversion Review",
-            "",
-            f"## Automatic Conversion: {automation_percentage:.0f}%",
-            f"## Manual Review Required: {100 - automation_percentage:.0f}%",
-            ""
-        ]
-
-        if manual_review_items:
-            lines.extend([
-                "### Items Requiring Review:",
-                ""
-            ])
-
-            for i, item in enumerate(manual_review_items, 1):
-                severity = item.get('severity', 'medium')
-                issue = item.get('issue', 'Unknown issue')
-                source_line = item.get('source_line', '?')
-                pattern = item.get('pattern', '')
-
-                lines.append(f"{i}. **{issue}** (line {source_line})")
-                lines.append(f"   - Severity: {severity}")
-
-                if pattern:
-                    lines.append(f"   - Pattern: `{pattern}`")
-
-                if 'action' in item:
-                    lines.append(f"   - Action: {item['action']}")
-
-                lines.append("")
-        else:
-            lines.append("No manual review items! ✅")
+        title = self.component_name.title()
+        header = (
+            f"# {title} Conversion Review\n"
+            "\n"
+            f"## Automatic Conversion: {automation_percentage:.0f}%\n"
+            f"## Manual Review Required: {100 - automation_percentage:.0f}%\n"
+            "\n"
+        )
+
+        # Common case: nothing to review
+        if not manual_review_items:
+            return f"{header}No manual review items! ✅\n"
+
+        lines = [f"{header}### Items Requiring Review:", ""]
+
+        for i, item in enumerate(manual_review_items, 1):
+            severity = item.get('severity', 'medium')
+            issue = item.get('issue', 'Unknown issue')
+            source_line = item.get('source_line', '?')
+            pattern = item.get('pattern', '')
+
+            # Heading and severity in one line entry
+            lines.append(f"{i}. **{issue}** (line {source_line})\n   - Severity: {severity}")
+
+            if pattern:
+                lines.append(f"   - Pattern: `{pattern}`")
+
+            if 'action' in item:
+                lines.append(f"   - Action: {item['action']}")
+
             lines.append("")
 
         return '\n'.join(lines)
@@ -1,10 +1,116 @@
 """Generate Jinja templates from parsed React components."""
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from ..parsers.interface_parser import AttributeInfo
+from ..parsers.js_parser import parse_utrecht_library
 from .class_builder import ClassBuilder
 
 
+def _format_list(value: list) -> str:
+    """Format a list default value as a Jinja list literal.
+
+    Args:
+        value: List of default items
+
+    Returns:
+        Formatted list string
+    """
+    if not value:
+        return "[]"
+
+    item_types = set(map(type, value))
+    if item_types == {str}:
+        # Common case (enum/string defaults): quote everything in one join
+        return "['" + "', '".join(value) + "']"
+    if not any(issubclass(item_type, str) for item_type in item_types):
+        return f"[{', '.join(map(str, value))}]"
+
+    items = ', '.join(f"'{item}'" if isinstance(item, str) else str(item) for item in value)
+    return f"[{items}]"
+
+
+# Attributes rendered directly as HTML attributes on the component element
+_COMMON_HTML_ATTRS = frozenset(('id', 'type', 'disabled', 'required', 'readonly', 'placeholder'))
+
+# Element attributes rendering the class list and the extra (event/data) attributes
+_CLASS_ATTR = 'class="{{ css_classes | join(\' \') }}"'
+_EXTRA_ATTRS = '{{ attrs.render_extra_attributes(_component_context) }}'
+
+# Jinja expression for the component's nested content (React 'children')
+_CONTENT_EXPR = '_component_context.content'
+
+# Components rendered as <c-...> tags when they appear in content
+_KNOWN_TAG_COMPONENTS = frozenset(('link', 'button', 'heading', 'paragraph'))
+
+# Reserved names renamed with an '_attr' suffix rather than a 'list_' prefix
+_ATTR_SUFFIXED_NAMES = frozenset(('type', 'filter', 'map'))
+
+# Props not forwarded as attributes of composed components
+_COMPOSITION_SKIPPED_PROPS = frozenset(('children', 'className'))
+
+# Template header around the component name: imports and auto-generated notice
+_HEADER_START = """{% import 'components/_generic_attributes.j2' as attrs %}
+{% import 'components/_attribute_mixin.j2' as attributes %}
+{# Auto-generated from React component: """
+_HEADER_END = """
+   Manual edits: wrap in MANUAL_START/MANUAL_END tags to preserve #}"""
+
+# Position before each uppercase letter except the first (PascalCase word boundary)
+_WORD_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+@lru_cache(maxsize=1024)
+def _to_kebab_case(pascal_case: str) -> str:
+    """Convert PascalCase to kebab-case.
+
+    Args:
+        pascal_case: PascalCase string
+
+    Returns:
+        kebab-case string
+    """
+    return _WORD_BOUNDARY_RE.sub('-', pascal_case).lower()
+
+
+@lru_cache(maxsize=256)
+def _utrecht_element_tags(component_name: str) -> Optional[Tuple[str, str]]:
+    """Build the opening and closing tags of a Utrecht component's primary element.
+
+    Args:
+        component_name: Utrecht component name (e.g., 'FieldsetLegend')
+
+    Returns:
+        Tuple of (opening tag with classes, closing tag), or None if the
+        component cannot be inlined
+    """
+    try:
+        component_info = parse_utrecht_library(component_name)
+    except (OSError, UnicodeDecodeError):
+        # Library bundle present but unreadable
+        return None
+
+    # Get the primary element (actual HTML tag)
+    primary = component_info.primary_element if component_info else None
+    if primary is None:
+        return None
+
+    classes = ' '.join(primary.classes)
+    return f'<{primary.tag} class="{classes}">', f'</{primary.tag}>'
+
+
+# Default value formatters keyed on exact type (subclasses use the isinstance chain)
+_DEFAULT_FORMATTERS = {
+    type(None): lambda value: "none",
+    bool: lambda value: "true" if value else "false",
+    str: lambda value: f"'{value}'",
+    int: str,
+    float: str,
+    list: _format_list,
+}
+
+
 class JinjaGenerator:
     """Generator for Jinja2 templates."""
 
@@ -26,10 +132,23 @@ class JinjaGenerator:
             component_name: Name of the component
         """
         self.component_name = component_name
+        self._data_attr = f'data-roos-component="{component_name}"'
         self.class_builder = ClassBuilder()
         self.variables: List[str] = []
         self.todo_comments: List[Dict[str, str]] = []
         self.name_mappings: Dict[str, str] = {}  # Maps original names to safe names
+        # ContentElement type -> handler appending its Jinja to the content parts
+        self._content_handlers: Dict[str, Callable[[Any, List[AttributeInfo], List[str]], None]] = {
+            'conditional': self._emit_conditional,
+            'ternary': self._emit_ternary,
+            'fallback': self._emit_fallback,
+            'variable': self._emit_variable,
+            'array_map': self._emit_array_map,
+            'fallback_chain': self._emit_fallback_chain,
+            'children_passthrough': self._emit_children_passthrough,
+            'conditional_component': self._emit_conditional_component,
+            'content_function': self._emit_content_function,
+        }
 
     def generate_template(
         self,
@@ -75,23 +194,22 @@ class JinjaGenerator:
         if not attributes and nested_components and len(nested_components) > 0:
             return self._generate_composition_template(nested_components, default_args, content_elements)
 
-        lines = []
-
-        # Add header comment
-        lines.append(self._generate_header())
-
-        # Generate variable declarations
-        lines.append(self._generate_variables(attributes, default_args))
+        lines = [
+            # Add header comment
+            self._generate_header(),
+            # Generate variable declarations
+            self._generate_variables(attributes, default_args),
+        ]
 
         # Generate CSS class building logic
         self.class_builder.add_base_classes(base_classes)
-        lines.append(self.class_builder.generate_jinja_code(name_mappings=self.name_mappings))
-
-        # Add utility classes from text-style, margin, padding attributes
-        lines.append(self._generate_utility_classes())
-
-        # Add custom classes from class attribute
-        lines.append(self._generate_custom_classes())
+        lines.extend([
+            self.class_builder.generate_jinja_code(name_mappings=self.name_mappings),
+            # Add utility classes from text-style, margin, padding attributes
+            self._generate_utility_classes(),
+            # Add custom classes from class attribute
+            self._generate_custom_classes(),
+        ])
 
         # If there's a wrapper, generate separate wrapper classes
         if wrapper_info:
@@ -124,7 +242,7 @@ class JinjaGenerator:
         """
         if attr_name in self.RESERVED_NAMES:
             # Add prefix to avoid conflict
-            safe_name = f"{attr_name}_attr" if attr_name in ['type', 'filter', 'map'] else f"list_{attr_name}"
+            safe_name = f"{attr_name}_attr" if attr_name in _ATTR_SUFFIXED_NAMES else f"list_{attr_name}"
             self.name_mappings[attr_name] = safe_name
             return safe_name
         return attr_name
@@ -149,7 +267,6 @@ class JinjaGenerator:
         Returns:
             Text with mapped variable names
         """
-        import re
         result = text
         # Sort by length descending to avoid partial matches
         for original, mapped in sorted(self.name_mappings.items(), key=lambda x: len(x[0]), reverse=True):
@@ -163,10 +280,7 @@ class JinjaGenerator:
         Returns:
             Header comment
         """
-        return f"""{{% import 'components/_generic_attributes.j2' as attrs %}}
-{{% import 'components/_attribute_mixin.j2' as attributes %}}
-{'{#'} Auto-generated from React component: {self.component_name}
-   Manual edits: wrap in MANUAL_START/MANUAL_END tags to preserve {'#}'}"""
+        return f"{_HEADER_START}{self.component_name}{_HEADER_END}"
 
     def _generate_variables(self, attributes: List[AttributeInfo], default_args: Dict[str, Any]) -> str:
         """Generate Jinja variable declarations.
@@ -179,6 +293,9 @@ class JinjaGenerator:
             Jinja variable declarations
         """
         lines = []
+        # Bound once for the loop below
+        append_line = lines.append
+        append_variable = self.variables.append
 
         for attr in attributes:
             # Skip function attributes
@@ -188,28 +305,30 @@ class JinjaGenerator:
             # Get safe variable name (avoid reserved names)
             safe_name = self._get_safe_variable_name(attr.name)
 
-            # Get default value
-            default = self._get_default_value(attr, default_args)
-
             # Generate variable declaration
             # Special case: React 'children' prop maps to '_component_context.content' in Jinja
             if attr.name == 'children':
                 # Children is nested content, accessed via .content not .children
                 # Use .get() for consistency - more reliable than | default filter
-                var_line = f"{{% set children = _component_context.get('content', '') %}}"
-            elif default is not None:
+                append_line("{% set children = _component_context.get('content', '') %}")
+                append_variable(safe_name)
+                continue
+
+            # Get default value
+            default = self._get_default_value(attr, default_args)
+
+            if default is not None:
                 # Format default value
                 default_str = self._format_default_value(default, attr)
                 # Use .get(key, default) for all cases - more reliable than Jinja's | default filter
                 # .get() returns None when key is missing, and Jinja's default filter doesn't replace None
                 # Using .get(key, default) ensures the default is applied by Python, not Jinja
-                var_line = f"{{% set {safe_name} = _component_context.get('{attr.name}', {default_str}) %}}"
+                append_line(f"{{% set {safe_name} = _component_context.get('{attr.name}', {default_str}) %}}")
             else:
                 # No default - use .get() for dict-safe access
-                var_line = f"{{% set {safe_name} = _component_context.get('{attr.name}') %}}"
+                append_line(f"{{% set {safe_name} = _component_context.get('{attr.name}') %}}")
 
-            lines.append(var_line)
-            self.variables.append(safe_name)
+            append_variable(safe_name)
 
         return '\n'.join(lines)
 
@@ -232,7 +351,7 @@ class JinjaGenerator:
             return value
 
         # Use type-based defaults
-        if 'boolean' in attr.types:
+        if attr.is_boolean:
             return False
         if 'array' in attr.types:
             return []  # Arrays default to empty list
@@ -253,8 +372,10 @@ class JinjaGenerator:
         Returns:
             Formatted value string
         """
-        if value is None:
-            return "none"
+        formatter = _DEFAULT_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+
         if isinstance(value, bool):
             return "true" if value else "false"
         if isinstance(value, str):
@@ -262,8 +383,7 @@ class JinjaGenerator:
         if isinstance(value, (int, float)):
             return str(value)
         if isinstance(value, list):
-            items = ', '.join(f"'{item}'" if isinstance(item, str) else str(item) for item in value)
-            return f"[{items}]"
+            return _format_list(value)
 
         return "none"
 
@@ -299,8 +419,7 @@ class JinjaGenerator:
         Returns:
             Jinja variable declaration for wrapper classes
         """
-        classes_str = ', '.join(f"'{cls}'" for cls in wrapper_info['classes'])
-        return f"{{% set wrapper_classes = [{classes_str}] %}}"
+        return f"{{% set wrapper_classes = [{', '.join(map(repr, wrapper_info['classes']))}] %}}"
 
     def _generate_html_element(self, tag: str, attributes: List[AttributeInfo], content: str, wrapper_info: Optional[Dict] = None, dynamic_tag: Optional[Dict] = None) -> str:
         """Generate HTML element with attributes.
@@ -324,33 +443,28 @@ class JinjaGenerator:
         # If there's a wrapper, generate wrapper opening tag
         if wrapper_info:
             wrapper_tag = wrapper_info['tag']
-            wrapper_opening = f'<{wrapper_tag} class="{{{{ wrapper_classes | join(\' \') }}}}" data-roos-component="{self.component_name}">'
+            wrapper_opening = f'<{wrapper_tag} class="{{{{ wrapper_classes | join(\' \') }}}}" {self._data_attr}>'
             lines.append(wrapper_opening)
 
         # Inner element opening tag
-        inner_attrs = [
-            'class="{{ css_classes | join(\' \') }}"'
-        ]
+        inner_attrs = [_CLASS_ATTR]
 
         # Add data-roos-component only if there's no wrapper (wrapper has it)
         if not wrapper_info:
-            inner_attrs.append(f'data-roos-component="{self.component_name}"')
+            inner_attrs.append(self._data_attr)
+
+        common_attrs, passthrough_attrs = self._partition_element_attributes(attributes)
 
         # Add common HTML attributes
-        common_attrs = ['id', 'type', 'disabled', 'required', 'readonly', 'placeholder']
-        for attr in attributes:
-            # Skip if this attribute is a pass-through attribute (will be handled separately)
-            if hasattr(attr, '_passthrough_target'):
-                continue
-            if attr.name in common_attrs:
-                attr_str = self._generate_html_attribute(attr)
-                if attr_str:
-                    inner_attrs.append(attr_str)
+        for attr in common_attrs:
+            attr_str = self._generate_html_attribute(attr)
+            if attr_str:
+                inner_attrs.append(attr_str)
 
         # Add pass-through attributes (attributes with _passthrough_target metadata)
-        for attr in attributes:
-            # Check if this attribute has pass-through metadata and targets the current element
-            if hasattr(attr, '_passthrough_target') and attr._passthrough_target == tag:
+        for attr in passthrough_attrs:
+            # Only those targeting the current element
+            if attr._passthrough_target == tag:
                 # Get the target attribute name (might be different from the variable name)
                 target_attr_name = getattr(attr, '_passthrough_attribute', attr.name)
                 attr_str = self._generate_html_attribute_custom(attr, target_attr_name)
@@ -358,14 +472,12 @@ class JinjaGenerator:
                     inner_attrs.append(attr_str)
 
         # Add event handlers via mixin
-        inner_attrs.append('{{ attrs.render_extra_attributes(_component_context) }}')
+        inner_attrs.append(_EXTRA_ATTRS)
 
-        # Build inner tag
-        opening_tag = f"<{tag}"
-        for attr in inner_attrs:
-            indent = "        " if wrapper_info else "    "
-            opening_tag += f"\n{indent}{attr}"
-        opening_tag += ">"
+        # Build inner tag, one attribute per line
+        indent = "        " if wrapper_info else "    "
+        attr_separator = f"\n{indent}"
+        opening_tag = attr_separator.join([f"<{tag}", *inner_attrs]) + ">"
 
         if wrapper_info:
             lines.append("    " + opening_tag)
@@ -373,7 +485,6 @@ class JinjaGenerator:
             lines.append(opening_tag)
 
         # Content
-        indent = "        " if wrapper_info else "    "
         if content:
             lines.append(f"{indent}{content}")
         else:
@@ -388,8 +499,7 @@ class JinjaGenerator:
 
         # Closing tags
         if wrapper_info:
-            lines.append(f"    </{tag}>")
-            lines.append(f"</{wrapper_info['tag']}>")
+            lines.extend([f"    </{tag}>", f"</{wrapper_info['tag']}>"])
         else:
             lines.append(f"</{tag}>")
 
@@ -423,47 +533,40 @@ class JinjaGenerator:
         # If there's a wrapper, generate wrapper opening tag
         if wrapper_info:
             wrapper_tag = wrapper_info['tag']
-            wrapper_opening = f'<{wrapper_tag} class="{{{{ wrapper_classes | join(\' \') }}}}" data-roos-component="{self.component_name}">'
+            wrapper_opening = f'<{wrapper_tag} class="{{{{ wrapper_classes | join(\' \') }}}}" {self._data_attr}>'
             lines.append(wrapper_opening)
 
         # Inner element opening tag with dynamic tag
-        inner_attrs = [
-            'class="{{ css_classes | join(\' \') }}"'
-        ]
+        inner_attrs = [_CLASS_ATTR]
 
         # Add data-roos-component only if there's no wrapper
         if not wrapper_info:
-            inner_attrs.append(f'data-roos-component="{self.component_name}"')
+            inner_attrs.append(self._data_attr)
+
+        common_attrs, passthrough_attrs = self._partition_element_attributes(attributes)
 
         # Add common HTML attributes
-        common_attrs = ['id', 'type', 'disabled', 'required', 'readonly', 'placeholder']
-        for attr in attributes:
-            if hasattr(attr, '_passthrough_target'):
-                continue
-            if attr.name in common_attrs:
-                attr_str = self._generate_html_attribute(attr)
-                if attr_str:
-                    inner_attrs.append(attr_str)
+        for attr in common_attrs:
+            attr_str = self._generate_html_attribute(attr)
+            if attr_str:
+                inner_attrs.append(attr_str)
 
         # Add pass-through attributes
-        for attr in attributes:
-            if hasattr(attr, '_passthrough_target'):
-                # For dynamic tags, we don't know the tag name at generation time
-                # so we skip the tag check and add all pass-through attrs
-                target_attr_name = getattr(attr, '_passthrough_attribute', attr.name)
-                attr_str = self._generate_html_attribute_custom(attr, target_attr_name)
-                if attr_str:
-                    inner_attrs.append(attr_str)
+        # For dynamic tags, we don't know the tag name at generation time
+        # so we skip the tag check and add all pass-through attrs
+        for attr in passthrough_attrs:
+            target_attr_name = getattr(attr, '_passthrough_attribute', attr.name)
+            attr_str = self._generate_html_attribute_custom(attr, target_attr_name)
+            if attr_str:
+                inner_attrs.append(attr_str)
 
         # Add event handlers via mixin
-        inner_attrs.append('{{ attrs.render_extra_attributes(_component_context) }}')
+        inner_attrs.append(_EXTRA_ATTRS)
 
-        # Build dynamic opening tag
-        opening_tag = "<{{ tag_name }}"
-        for attr in inner_attrs:
-            indent = "        " if wrapper_info else "    "
-            opening_tag += f"\n{indent}{attr}"
-        opening_tag += ">"
+        # Build dynamic opening tag, one attribute per line
+        indent = "        " if wrapper_info else "    "
+        attr_separator = f"\n{indent}"
+        opening_tag = attr_separator.join(["<{{ tag_name }}", *inner_attrs]) + ">"
 
         if wrapper_info:
             lines.append("    " + opening_tag)
@@ -471,7 +574,6 @@ class JinjaGenerator:
             lines.append(opening_tag)
 
         # Content
-        indent = "        " if wrapper_info else "    "
         if content:
             lines.append(f"{indent}{content}")
         else:
@@ -484,13 +586,31 @@ class JinjaGenerator:
 
         # Closing tags
         if wrapper_info:
-            lines.append("    </{{ tag_name }}>")
-            lines.append(f"</{wrapper_info['tag']}>")
+            lines.extend(["    </{{ tag_name }}>", f"</{wrapper_info['tag']}>"])
         else:
             lines.append("</{{ tag_name }}>")
 
         return '\n'.join(lines)
 
+    def _partition_element_attributes(self, attributes: List[AttributeInfo]) -> Tuple[List[AttributeInfo], List[AttributeInfo]]:
+        """Split attributes into common HTML attributes and pass-through attributes.
+
+        Args:
+            attributes: List of attributes
+
+        Returns:
+            Tuple of (common HTML attributes, pass-through attributes), in input order
+        """
+        common_attrs = []
+        passthrough_attrs = []
+        for attr in attributes:
+            # Pass-through attributes are handled separately, even if their name is common
+            if hasattr(attr, '_passthrough_target'):
+                passthrough_attrs.append(attr)
+            elif attr.name in _COMMON_HTML_ATTRS:
+                common_attrs.append(attr)
+        return common_attrs, passthrough_attrs
+
     def _generate_html_attribute(self, attr: AttributeInfo) -> Optional[str]:
         """Generate HTML attribute string.
 
@@ -503,7 +623,7 @@ class JinjaGenerator:
         # Get the mapped variable name (for reserved words)
         var_name = self._get_mapped_name(attr.name)
 
-        if 'boolean' in attr.types:
+        if attr.is_boolean:
             # Boolean attributes
             return f"{{% if {var_name} %}}{attr.name}{{% endif %}}"
         else:
@@ -523,7 +643,7 @@ class JinjaGenerator:
         # Get the mapped variable name (for reserved words)
         var_name = self._get_mapped_name(attr.name)
 
-        if 'boolean' in attr.types:
+        if attr.is_boolean:
             # Boolean attributes
             return f"{{% if {var_name} %}}{target_attr_name}{{% endif %}}"
         else:
@@ -540,117 +660,185 @@ class JinjaGenerator:
         Returns:
             Generated content string
         """
+        if not content_elements:
+            return ""
+        # Common case: the content is a single variable reference
+        if len(content_elements) == 1 and content_elements[0].type == 'variable':
+            return f"{{{{ {content_elements[0].content} }}}}"
+
         parts = []
+        content_handlers = self._content_handlers
 
         for element in content_elements:
-            if element.type == 'conditional':
-                # Convert React conditional to Jinja
-                jinja_condition = self._convert_condition_to_jinja(element.condition)
-                content_part = self._generate_element_content(element, attributes)
-                parts.append(f"{{% if {jinja_condition} %}}{content_part}{{% endif %}}")
-
-            elif element.type == 'ternary':
-                # Convert React ternary to Jinja inline if
-                # children ? parseContentMarkup(children) : fields → {{ _component_context.content if _component_context.content else '...' }}
-                condition = self._convert_condition_to_jinja(element.condition)
-                if element.fallback_chain and len(element.fallback_chain) == 2:
-                    true_val = element.fallback_chain[0].strip()
-                    false_val = element.fallback_chain[1].strip()
-
-                    # Convert condition variable (e.g., 'children' → '_component_context.content')
-                    if condition == 'children':
-                        condition = '_component_context.content'
-
-                    # Convert true value (e.g., 'parseContentMarkup(children)' → '_component_context.content')
-                    if 'parseContentMarkup(children)' in true_val:
-                        true_val = '_component_context.content | safe'
-                    elif true_val == 'children':
-                        true_val = '_component_context.content | safe'
-
-                    # Convert false value - if it's complex, add TODO
-                    if 'fields' in false_val and '.map(' in false_val:
-                        # Complex expression - need to handle separately
-                        parts.append(f"{{{{ {condition} if {condition} else '' }}}}")
-                        parts.append("{# TODO_CONVERSION: Handle fields.map rendering #}")
-                    else:
-                        parts.append(f"{{{{ {true_val} if {condition} else {false_val} }}}}")
+            handler = content_handlers.get(element.type)
+            if handler is not None:
+                handler(element, attributes, parts)
+
+        # Multi-line parts go on their own lines; a part has a newline iff the concatenation does
+        joined = ''.join(parts)
+        return '\n'.join(parts) if '\n' in joined else joined
+
+    def _emit_conditional(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a React conditional (cond && <X/>) as a Jinja if block.
+
+        Args:
+            element: ContentElement of type 'conditional'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        jinja_condition = self._convert_condition_to_jinja(element.condition)
+        content_part = self._generate_element_content(element, attributes)
+        parts.append(f"{{% if {jinja_condition} %}}{content_part}{{% endif %}}")
+
+    def _emit_ternary(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a React ternary as a Jinja inline if.
+
+        children ? parseContentMarkup(children) : fields → {{ _component_context.content if _component_context.content else '...' }}
+
+        Args:
+            element: ContentElement of type 'ternary'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        condition = self._convert_condition_to_jinja(element.condition)
+        if element.fallback_chain and len(element.fallback_chain) == 2:
+            true_val = element.fallback_chain[0].strip()
+            false_val = element.fallback_chain[1].strip()
+
+            # Convert condition variable (e.g., 'children' → '_component_context.content')
+            if condition == 'children':
+                condition = _CONTENT_EXPR
+
+            # Convert true value (e.g., 'parseContentMarkup(children)' → '_component_context.content')
+            if 'parseContentMarkup(children)' in true_val:
+                true_val = f'{_CONTENT_EXPR} | safe'
+            elif true_val == 'children':
+                true_val = f'{_CONTENT_EXPR} | safe'
+
+            # Convert false value - if it's complex, add TODO
+            if 'fields' in false_val and '.map(' in false_val:
+                # Complex expression - need to handle separately
+                parts.append(f"{{{{ {condition} if {condition} else '' }}}}")
+                parts.append("{# TODO_CONVERSION: Handle fields.map rendering #}")
+            else:
+                parts.append(f"{{{{ {true_val} if {condition} else {false_val} }}}}")
+        else:
+            # Fallback if parsing failed
+            parts.append("{# TODO_CONVERSION: Ternary expression not fully parsed #}")
+
+    def _emit_fallback(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a React fallback (||) as chained Jinja inline ifs.
+
+        children || label → {{ _component_context.content if _component_context.content else label }}
+
+        Args:
+            element: ContentElement of type 'fallback'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        if element.fallback_chain:
+            # Replace 'children' with '_component_context.content' in the fallback chain
+            converted_chain = []
+            for item in element.fallback_chain:
+                if item.strip() == 'children':
+                    converted_chain.append(_CONTENT_EXPR)
                 else:
-                    # Fallback if parsing failed
-                    parts.append("{# TODO_CONVERSION: Ternary expression not fully parsed #}")
-
-            elif element.type == 'fallback':
-                # Convert React fallback (||) to Jinja
-                # children || label → {{ _component_context.content if _component_context.content else label }}
-                if element.fallback_chain:
-                    # Replace 'children' with '_component_context.content' in the fallback chain
-                    converted_chain = []
-                    for item in element.fallback_chain:
-                        if item.strip() == 'children':
-                            converted_chain.append('_component_context.content')
-                        else:
-                            converted_chain.append(item.strip())
-
-                    # Build fallback expression
-                    fallback_expr = converted_chain[0]
-                    for fb in converted_chain[1:]:
-                        fallback_expr = f"{fallback_expr} if {fallback_expr} else {fb}"
-                    parts.append(f"{{{{ {fallback_expr} | safe }}}}")
-
-            elif element.type == 'variable':
-                # Simple variable reference
-                parts.append(f"{{{{ {element.content} }}}}")
-
-            elif element.type == 'array_map':
-                # Convert array.map() to Jinja for-loop with nested component
-                loop_content = self._generate_array_map_loop(element, attributes)
-                parts.append(loop_content)
-
-            elif element.type == 'fallback_chain':
-                # Generate if/elif structure from fallback chain
-                chain_content = self._generate_fallback_chain(element, attributes)
-                parts.append(chain_content)
-
-            elif element.type == 'children_passthrough':
-                # Simple children passthrough
-                if element.condition:
-                    parts.append(f"{{% if {element.condition} %}}")
-                parts.append("{{ children | safe }}")
-                if element.condition:
-                    parts.append("{% endif %}")
-
-            elif element.type == 'conditional_component':
-                # Conditional component rendering
-                # e.g., let labelMarkup = label; if (state === 'incomplete' || ...) { labelMarkup = <Link .../> }
-                jinja_condition = self._convert_condition_to_jinja(element.condition)
-
-                # Try to inline/convert the component
-                component_html = self._inline_component(element, attributes)
-
-                # Generate fallback (default value)
-                fallback = f"{{{{ {element.fallback_value} }}}}"
-
-                # Build if/else structure
-                parts.append(f"{{% if {jinja_condition} %}}")
-                parts.append(f"    {component_html}")
-                parts.append("{% else %}")
-                parts.append(f"    {fallback}")
-                parts.append("{% endif %}")
-
-            elif element.type == 'content_function':
-                # Content processing function
-                # e.g., const contentMarkup = parseContentMarkup(children || content)
-                # In Jinja: {% set contentMarkup = children or content %}
-                # Then output with: {{ contentMarkup | safe }}
-                var_name = element.content
-                args = element.component_props.get('_function_args', 'children or content')
-
-                # Convert React || to Jinja or
-                jinja_args = args.replace(' || ', ' or ')
-
-                # Output variable with safe filter (to allow HTML markup)
-                parts.append(f"{{{{ {jinja_args} | safe }}}}")
-
-        return '\n'.join(parts) if any('\n' in p for p in parts) else ''.join(parts)
+                    converted_chain.append(item.strip())
+
+            # Build fallback expression: "a if a else b if b else c" (right-associative,
+            # so each item appears once instead of the whole prefix being repeated)
+            fallback_expr = ' '.join([*(f"{item} if {item} else" for item in converted_chain[:-1]), converted_chain[-1]])
+            parts.append(f"{{{{ {fallback_expr} | safe }}}}")
+
+    def _emit_variable(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a simple variable reference.
+
+        Args:
+            element: ContentElement of type 'variable'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        parts.append(f"{{{{ {element.content} }}}}")
+
+    def _emit_array_map(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit array.map() as a Jinja for-loop with nested component.
+
+        Args:
+            element: ContentElement of type 'array_map'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        parts.append(self._generate_array_map_loop(element, attributes))
+
+    def _emit_fallback_chain(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit an if/elif structure from a fallback chain.
+
+        Args:
+            element: ContentElement of type 'fallback_chain'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        parts.append(self._generate_fallback_chain(element, attributes))
+
+    def _emit_children_passthrough(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a simple children passthrough, optionally conditional.
+
+        Args:
+            element: ContentElement of type 'children_passthrough'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        if element.condition:
+            parts.append(f"{{% if {element.condition} %}}")
+        parts.append("{{ children | safe }}")
+        if element.condition:
+            parts.append("{% endif %}")
+
+    def _emit_conditional_component(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit conditional component rendering as an if/else block.
+
+        e.g., let labelMarkup = label; if (state === 'incomplete' || ...) { labelMarkup = <Link .../> }
+
+        Args:
+            element: ContentElement of type 'conditional_component'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        jinja_condition = self._convert_condition_to_jinja(element.condition)
+
+        # Try to inline/convert the component
+        component_html = self._inline_component(element, attributes)
+
+        # Generate fallback (default value)
+        fallback = f"{{{{ {element.fallback_value} }}}}"
+
+        # Build if/else structure
+        parts.extend([
+            f"{{% if {jinja_condition} %}}",
+            f"    {component_html}",
+            "{% else %}",
+            f"    {fallback}",
+            "{% endif %}",
+        ])
+
+    def _emit_content_function(self, element, attributes: List[AttributeInfo], parts: List[str]) -> None:
+        """Emit a content processing function call.
+
+        e.g., const contentMarkup = parseContentMarkup(children || content)
+        In Jinja: {{ children or content | safe }}
+
+        Args:
+            element: ContentElement of type 'content_function'
+            attributes: List of AttributeInfo
+            parts: Content parts to append to
+        """
+        args = element.component_props.get('_function_args', 'children or content')
+
+        # Convert React || to Jinja or
+        jinja_args = args.replace(' || ', ' or ')
+
+        # Output variable with safe filter (to allow HTML markup)
+        parts.append(f"{{{{ {jinja_args} | safe }}}}")
 
     def _convert_condition_to_jinja(self, condition: str) -> str:
         """Convert React condition to Jinja condition.
@@ -663,15 +851,14 @@ class JinjaGenerator:
             Jinja condition like "showIcon == 'before'" or
                       "state == 'incomplete' or state == 'doing'"
         """
-        # Replace === with ==
-        jinja_cond = condition.replace(' === ', ' == ')
-        # Replace !== with !=
-        jinja_cond = jinja_cond.replace(' !== ', ' != ')
-        # Replace || with or
-        jinja_cond = jinja_cond.replace(' || ', ' or ')
-        # Replace && with and
-        jinja_cond = jinja_cond.replace(' && ', ' and ')
-        return jinja_cond
+        # Chained str.replace beats a regex pass on conditions this short
+        return (
+            condition
+            .replace(' === ', ' == ')
+            .replace(' !== ', ' != ')
+            .replace(' || ', ' or ')
+            .replace(' && ', ' and ')
+        )
 
     def _generate_element_content(self, element, attributes: List[AttributeInfo]) -> str:
         """Generate content for a single element.
@@ -731,32 +918,17 @@ class JinjaGenerator:
         Returns:
             Inlined HTML or None if not a Utrecht component
         """
-        try:
-            from ..parsers.js_parser import parse_utrecht_library
-
-            # Parse the Utrecht component
-            component_info = parse_utrecht_library(element.component_name)
-            if not component_info:
-                return None
-
-            # Get the primary element (actual HTML tag)
-            primary = component_info.primary_element
-
-            # Build the HTML tag with classes
-            classes = ' '.join(primary.classes)
-
-            # Get the content - usually it's just a variable reference
-            # For FieldsetLegend, it's {legend}
-            content_var = element.content if element.content else 'content'
-
-            # Build the HTML element
-            html = f'<{primary.tag} class="{classes}">{{{{ {content_var} }}}}</{primary.tag}>'
+        tags = _utrecht_element_tags(element.component_name)
+        if tags is None:
+            return None
+        opening_tag, closing_tag = tags
 
-            return html
+        # Get the content - usually it's just a variable reference
+        # For FieldsetLegend, it's {legend}
+        content_var = element.content if element.content else 'content'
 
-        except Exception:
-            # Auto-inlining failed
-            return None
+        # Build the HTML element
+        return f'{opening_tag}{{{{ {content_var} }}}}{closing_tag}'
 
     def _inline_icon_component(self, element, attributes: List[AttributeInfo]) -> str:
         """Inline Icon component as HTML.
@@ -799,13 +971,11 @@ class JinjaGenerator:
             Component tag string or None if component not found
         """
         # Convert component name to kebab-case (Link → link)
-        component_name_kebab = self._to_kebab_case(element.component_name)
+        component_name_kebab = _to_kebab_case(element.component_name)
 
         # Check if this component exists (basic check - could be improved)
         # For now, just generate the tag for common components like Link
-        known_components = ['link', 'button', 'heading', 'paragraph']
-
-        if component_name_kebab not in known_components:
+        if component_name_kebab not in _KNOWN_TAG_COMPONENTS:
             return None
 
         # Build component tag with props
@@ -888,10 +1058,12 @@ class JinjaGenerator:
                     # Generate for-loop without the wrapping if (already in if/elif)
                     # Use mapped name if the array name is a reserved word
                     safe_array_name = self._get_mapped_name(map_element.array_name)
-                    lines.append(f"        {{% for {map_element.item_var} in {safe_array_name} %}}")
                     component_tag = self._generate_nested_component_tag(map_element)
-                    lines.append(f"            {component_tag}")
-                    lines.append("        {% endfor %}")
+                    lines.extend([
+                        f"        {{% for {map_element.item_var} in {safe_array_name} %}}",
+                        f"            {component_tag}",
+                        "        {% endfor %}",
+                    ])
 
         lines.append("    {% endif %}")
         return '\n'.join(lines)
@@ -935,9 +1107,11 @@ class JinjaGenerator:
             # Check if children attribute exists
             has_children = any(attr.name == 'children' for attr in attributes)
             if has_children:
-                lines.append("        {% elif children %}")
-                lines.append("        {{ children | safe }}")
-                lines.append("        {% endif %}")
+                lines.extend([
+                    "        {% elif children %}",
+                    "        {{ children | safe }}",
+                    "        {% endif %}",
+                ])
 
         return '\n'.join(lines)
 
@@ -966,7 +1140,7 @@ class JinjaGenerator:
             tag_name = element.component_name
         elif not component_meta:
             # Fallback: convert component name to tag
-            tag_name = self._to_kebab_case(element.component_name)
+            tag_name = _to_kebab_case(element.component_name)
             tag_name = f'c-{tag_name}'
         else:
             tag_name = component_meta['tag_name']
@@ -1026,7 +1200,7 @@ class JinjaGenerator:
                 return f'{opening}</{tag_name}>'
 
     def _to_kebab_case(self, pascal_case: str) -> str:
-        """Convert PascalCase to kebab-case.
+        """Convert PascalCase to kebab-case (cached per name).
 
         Args:
             pascal_case: PascalCase string
@@ -1034,9 +1208,7 @@ class JinjaGenerator:
         Returns:
             kebab-case string
         """
-        import re
-        kebab = re.sub(r'(?<!^)(?=[A-Z])', '-', pascal_case)
-        return kebab.lower()
+        return _to_kebab_case(pascal_case)
 
     def add_todo_comment(self, description: str, source_file: str, source_line: int, action: str = "") -> None:
         """Add a TODO comment for manual review.
@@ -1092,12 +1264,12 @@ class JinjaGenerator:
         Returns:
             Generated Jinja template
         """
-        lines = []
-
         # Header
-        lines.append(self._generate_header())
-        lines.append("{# This is a composition component that wraps nested components #}")
-        lines.append("")
+        lines = [
+            self._generate_header(),
+            "{# This is a composition component that wraps nested components #}",
+            "",
+        ]
 
         # Collect all unique props from nested components
         all_props = set()
@@ -1164,21 +1336,21 @@ class JinjaGenerator:
             outer_props = outer_comp.get('props', [])
             outer_attrs = []
             for prop in outer_props:
-                if prop not in ['children', 'className']:
+                if prop not in _COMPOSITION_SKIPPED_PROPS:
                     outer_attrs.append(f'{prop}="{{{{ {prop} }}}}"')
 
             # Generate attributes for inner component
             inner_props = inner_comp.get('props', [])
             inner_attrs = []
             for prop in inner_props:
-                if prop not in ['children', 'className']:
+                if prop not in _COMPOSITION_SKIPPED_PROPS:
                     inner_attrs.append(f'{prop}="{{{{ {prop} }}}}"')
 
             # Build nested structure
             lines = [f"<{outer_tag}"]
             for attr in outer_attrs:
                 lines.append(f"    {attr}")
-            lines.append("    {{ attrs.render_extra_attributes(_component_context) }}>")
+            lines.append(f"    {_EXTRA_ATTRS}>")
 
             lines.append(f"    <{inner_tag}")
             for attr in inner_attrs:
@@ -1,7 +1,7 @@
 """Parse JSX content/children rendering logic."""
 
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 
 
@@ -607,7 +607,7 @@ class ContentParser:
             condition=condition
         )
 
-    def resolve_component_references(self, source_content: str) -> Dict[str, Dict]:
+    def resolve_component_references(self, source_content: str, needed: Optional[Set[str]] = None) -> Dict[str, Dict]:
         """Resolve component variable references to their definitions.
 
         For example, if iconMarkup = <Icon .../>, return the Icon component info.
@@ -621,11 +621,15 @@ class ContentParser:
 
         Args:
             source_content: Full source file content
+            needed: Optional set of variable names to resolve; other
+                assignments are skipped (None resolves all of them)
 
         Returns:
             Dict mapping variable names to component info
         """
         references = {}
+        if needed is not None and not needed:
+            return references
 
         # Pattern 0: Content processing utility functions
         # Matches: const/let varName = anyFunctionName(children || content)
@@ -635,6 +639,8 @@ class ContentParser:
 
         for match in re.finditer(content_function_pattern, source_content):
             var_name = match.group(1)
+            if needed is not None and var_name not in needed:
+                continue
             function_name = match.group(2)
             args = match.group(3).strip()
 
@@ -651,6 +657,8 @@ class ContentParser:
 
         for match in re.finditer(pattern, source_content):
             var_name = match.group(1)
+            if needed is not None and var_name not in needed:
+                continue
             component_name = match.group(2)
             props_str = match.group(3).strip()
 
@@ -671,6 +679,8 @@ class ContentParser:
 
         for match in re.finditer(conditional_pattern, source_content):
             var_name = match.group(1)
+            if needed is not None and var_name not in needed:
+                continue
             default_value = match.group(2).strip()
             condition = match.group(3).strip()
             component_name = match.group(4)
@@ -1,8 +1,9 @@
 """Parse TypeScript interfaces from React component files."""
 
 import re
+import sys
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from ..utils.ast_helpers import (
     strip_comments,
     extract_enum_values,
@@ -23,6 +24,13 @@ class AttributeInfo:
     description: str = ""
     is_function: bool = False
     function_signature: Optional[str] = None
+    is_boolean: bool = field(init=False, repr=False, compare=False)  # 'boolean' in types
+
+    def __post_init__(self):
+        # Parsed names and type names recur across components; share one object each
+        self.name = sys.intern(self.name)
+        self.types = [sys.intern(type_name) for type_name in self.types]
+        self.is_boolean = 'boolean' in self.types
 
 
 class InterfaceParser:
@@ -3,6 +3,7 @@
 import re
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -449,9 +450,12 @@ class ComponentLibraryJSParser:
         return elements[-1]
 
 
+@lru_cache(maxsize=None)
 def parse_utrecht_library(component_name: str) -> Optional[ComponentRenderInfo]:
     """Parse a component from Utrecht component library.
 
+    Results are cached per component name; treat them as read-only.
+
     Args:
         component_name: Name of the component (e.g., 'Fieldset')
 
@@ -459,8 +463,6 @@ def parse_utrecht_library(component_name: str) -> Optional[ComponentRenderInfo]:
         ComponentRenderInfo or None if not found
     """
     # Find Utrecht component library
-    from pathlib import Path
-
     # Look for it in RVO's node_modules
     utrecht_path = Path(__file__).parent.parent.parent.parent / 'rvo' / 'node_modules' / '@utrecht' / 'component-library-react'
 
@@ -10,6 +10,7 @@ class SwitchCase:
     """A single case in a switch statement."""
     values: List[str]  # Case values (can have multiple for fall-through)
     result: str  # What it resolves to
+    is_variable: bool = False  # True if result is a variable reference, not a string literal
 
 
 @dataclass
@@ -134,7 +135,8 @@ class SwitchParser:
                 if current_case_values or is_default:
                     cases.append(SwitchCase(
                         values=current_case_values.copy() if current_case_values else ['__DEFAULT__'],
-                        result=result_value
+                        result=result_value,
+                        is_variable=True
                     ))
                     current_case_values = []
                     is_default = False
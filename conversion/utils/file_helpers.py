@@ -1,8 +1,15 @@
 """File I/O helper utilities."""
 
 import hashlib
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+
+# Directory listings of the (read-only) RVO source tree, keyed by directory path
+_dir_listing_cache: dict[str, frozenset[str]] = {}
 
 
 def read_file(file_path: str | Path) -> str:
@@ -36,6 +43,36 @@ def write_file(file_path: str | Path, content: str) -> None:
         f.write(content)
 
 
+def read_json(file_path: str | Path) -> Any:
+    """Read and parse a JSON file.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(file_path: str | Path, data: Any, trailing_newline: bool = True) -> None:
+    """Write data as 2-space indented JSON.
+
+    Non-ASCII characters are written as-is.
+
+    Args:
+        file_path: Path to file
+        data: JSON-serializable data
+        trailing_newline: Whether to end the file with a newline
+    """
+    # json.dump writes many small chunks; a larger buffer batches them into few writes
+    with open(file_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        if trailing_newline:
+            f.write('\n')
+
+
 def ensure_dir(dir_path: str | Path) -> Path:
     """Ensure directory exists.
 
@@ -50,8 +87,9 @@ def ensure_dir(dir_path: str | Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=64)
 def compute_hash(content: str) -> str:
-    """Compute SHA256 hash of content.
+    """Compute SHA256 hash of content, cached for recently hashed sources.
 
     Args:
         content: Content to hash
@@ -74,6 +112,31 @@ def file_exists(file_path: str | Path) -> bool:
     return Path(file_path).exists()
 
 
+def list_dir_names(dir_path: str | Path) -> frozenset[str]:
+    """List entry names in a directory, cached per directory.
+
+    One scandir answers every existence check for files in the same
+    directory. Only use this for source directories that do not change
+    during a conversion run; output directories must be checked directly.
+
+    Args:
+        dir_path: Path to directory
+
+    Returns:
+        Names of the directory entries (empty if the directory does not exist)
+    """
+    key = str(dir_path)
+    names = _dir_listing_cache.get(key)
+    if names is None:
+        try:
+            with os.scandir(key) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            names = frozenset()
+        _dir_listing_cache[key] = names
+    return names
+
+
 def get_project_root() -> Path:
     """Get project root directory.
 
@@ -14,7 +14,7 @@ from typing import List, Dict, Optional
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from conversion.convert_component import ComponentConverter
+from conversion.convert_component import ComponentConverter, batch_alias_registration
 
 
 # Skip problematic components and their dependents
@@ -208,20 +208,21 @@ Examples:
     successful = []
     failed = []
 
-    # Regenerate each component
-    for definition_file in sorted(definition_files):
-
-        if regenerate_component(
-            definition_file,
-            verbose=args.verbose
-        ):
-            successful.append(definition_file.stem)
-        else:
-            failed.append(definition_file.stem)
-
-        # Add spacing between components only in verbose mode
-        if args.verbose:
-            print()
+    # Regenerate each component, writing alias registrations once at the end
+    with batch_alias_registration():
+        for definition_file in sorted(definition_files):
+
+            if regenerate_component(
+                definition_file,
+                verbose=args.verbose
+            ):
+                successful.append(definition_file.stem)
+            else:
+                failed.append(definition_file.stem)
+
+            # Add spacing between components only in verbose mode
+            if args.verbose:
+                print()
 
     # Summary
     print("=" * 60)
@@ -0,0 +1,11 @@
+import { ISampleButtonProps } from './template';
+
+export const defaultArgs: ISampleButtonProps = {
+  kind: 'primary',
+  size: 'md',
+  showIcon: 'no',
+  icon: 'home',
+  label: 'Button label',
+  items: ['a', 'b'],
+  count: 3,
+};
@@ -0,0 +1,85 @@
+import React from 'react';
+import clsx from 'clsx';
+import { Button as UtrechtButton } from '@utrecht/component-library-react';
+import { Icon } from '../../icon/src/template';
+import { defaultArgs } from './defaultArgs';
+import parseContentMarkup from '../../utils/parseContentMarkup';
+
+export interface ISampleButtonProps {
+  /** The kind */
+  kind?: 'primary' | 'secondary' | 'tertiary' | 'warning' | 'warning-subtle';
+  size?: 'xs' | 'sm' | 'md';
+  busy?: boolean;
+  disabled?: boolean;
+  showIcon?: 'no' | 'before' | 'after';
+  icon?: string;
+  iconAriaLabel?: string;
+  label?: string;
+  fullWidth?: boolean;
+  noMargin?: boolean;
+  type?: 'button' | 'submit' | 'reset';
+  items?: string[];
+  count?: number;
+  children?: React.ReactNode;
+  onClick?: (event: any) => void;
+}
+
+export const SampleButton: React.FC<ISampleButtonProps> = ({
+  kind = defaultArgs.kind,
+  size = defaultArgs.size,
+  busy,
+  disabled,
+  showIcon = defaultArgs.showIcon,
+  icon = defaultArgs.icon,
+  iconAriaLabel,
+  label = defaultArgs.label,
+  fullWidth = false,
+  noMargin,
+  type = 'button',
+  items,
+  count,
+  children,
+  onClick,
+}: ISampleButtonProps) => {
+  let appearance = undefined;
+  switch (kind) {
+    case 'primary':
+      appearance = 'primary-action-button';
+      break;
+    case 'secondary':
+    case 'warning':
+      appearance = 'secondary-action-button';
+      break;
+    default:
+      appearance = 'subtle-button';
+  }
+
+  const iconMarkup = <Icon icon={icon as any} size={size} ariaLabel={iconAriaLabel} />;
+  const contentMarkup = parseContentMarkup(children || label);
+
+  return (
+    <UtrechtButton
+      appearance={appearance}
+      busy={busy}
+      hint={kind === 'warning' || kind === 'warning-subtle' ? 'warning' : undefined}
+      className={clsx(
+        'rvo-button',
+        { 'rvo-button--full-width': fullWidth, 'rvo-button--active': !disabled, 'rvo-button--big': size === 'md' },
+        size === 'xs' && 'rvo-button--xs',
+        showIcon !== 'no' && `utrecht-button--icon-${showIcon}`,
+        kind === 'warning' && noMargin && 'rvo-button--nm',
+        noMargin && 'rvo-button--no-margin',
+        !busy && 'rvo-button--idle',
+        size && 'rvo-size-' + size,
+        `rvo-button--kind-${kind}`,
+      )}
+      onClick={onClick}
+    >
+      {showIcon === 'before' && iconMarkup}
+      {contentMarkup}
+      {showIcon === 'after' && iconMarkup}
+    </UtrechtButton>
+  );
+};
+
+export default SampleButton;
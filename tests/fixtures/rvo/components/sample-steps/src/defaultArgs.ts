@@ -0,0 +1,17 @@
+import { ISampleStepsProps } from './template';
+
+export const defaultSteps = [
+  { state: 'completed', label: 'Step one', size: 'md', line: 'none', },
+  { state: 'doing', label: 'Step two', size: 'md', line: 'substep-start' },
+];
+
+export const defaultOther = [
+  { a: 1, b: 'x' },
+];
+
+export const defaultArgs: ISampleStepsProps = {
+  steps: defaultSteps,
+  type: 'ordered',
+  other: defaultOther,
+  missing: defaultMissing,
+};
@@ -0,0 +1,26 @@
+import React from 'react';
+import clsx from 'clsx';
+import { Link } from '../../../../link/src/template';
+
+export interface ISampleStepProps {
+  state?: 'completed' | 'doing' | 'incomplete';
+  label?: string;
+  size?: 'sm' | 'md';
+  line?: 'substep-start' | 'none';
+  link?: string;
+}
+
+export const SampleStep: React.FC<ISampleStepProps> = ({ state, label, size, line, link }: ISampleStepProps) => {
+  let labelMarkup: any = label;
+  if (state === 'incomplete' || state === 'doing') {
+    labelMarkup = <Link href={link} content={label} />;
+  }
+
+  return (
+    <li className={clsx('rvo-step', `rvo-step--${state}`, `rvo-step__size--${line !== 'substep-start' ? size : 'md'}`)}>
+      {labelMarkup}
+    </li>
+  );
+};
+
+export default SampleStep;
@@ -0,0 +1,28 @@
+import React from 'react';
+import clsx from 'clsx';
+import { SampleStep, ISampleStepProps } from './sample-step/src/template';
+import { defaultArgs } from './defaultArgs';
+
+export interface ISampleStepsProps {
+  steps?: ISampleStepProps[];
+  type?: 'ordered' | 'unordered';
+  children?: React.ReactNode;
+}
+
+export const SampleSteps: React.FC<ISampleStepsProps> = ({
+  steps = defaultArgs.steps,
+  type = defaultArgs.type,
+  children,
+}: ISampleStepsProps) => {
+  const ListTag = type === 'unordered' ? 'ul' : 'ol';
+  return (
+    <div className="rvo-steps">
+      <ListTag className={clsx('rvo-steps__list', type === 'unordered' && 'rvo-steps__list--u')}>
+        {(children && React.Children.map(children, (child) => <SampleStep {...(child as any).props} />)) ||
+          (steps && steps.map((step) => <SampleStep {...step} />))}
+      </ListTag>
+    </div>
+  );
+};
+
+export default SampleSteps;
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the conversion ClassBuilder.
+Checks that the alternative code generators build the same class lists
+as the Jinja code from generate_jinja_code.
+"""
+
+import pytest
+from jinja2 import Environment
+
+from conversion.generators.class_builder import ClassBuilder
+
+
+# Render contexts covering set, unset and None values
+CONTEXTS = [
+    {},
+    {'kind': 'primary'},
+    {'kind': 'secondary', 'disabled': True},
+    {'kind': 'tertiary', 'disabled': False, 'size': 'sm'},
+    {'kind': None, 'disabled': None, 'size': None, 'state': None},
+    {'kind': 'primary', 'disabled': True, 'size': 'xl', 'state': 'open'},
+]
+
+
+def render_classes(jinja_code, context):
+    """Render class building code and return the resulting class list."""
+    template = Environment().from_string(jinja_code + "{{ css_classes | join(' ') }}")
+    return template.render(**context).split()
+
+
+def build_mixed_builder():
+    """Builder mixing enum, boolean, size and template classes."""
+    builder = ClassBuilder()
+    builder.add_base_classes(['btn'])
+    builder.add_enum_classes('kind', {'primary': ['btn--primary'], 'secondary': ['btn--secondary']})
+    builder.add_boolean_class('disabled', 'btn--disabled')
+    builder.add_conditional_class('btn--primary-extra', "kind == 'primary'")
+    builder.add_size_classes(prefix='btn--')
+    builder.add_boolean_class('disabled', 'btn--enabled', negate=True)
+    builder.add_conditional_class('btn--secondary-extra', "kind == 'secondary'")
+    builder.add_template_class('btn--${state}', 'state')
+    return builder
+
+
+@pytest.mark.parametrize('context', CONTEXTS)
+def test_fused_matches_jinja_code(context):
+    """The single-assignment code builds the same classes in the same order."""
+    builder = build_mixed_builder()
+    expected = render_classes(builder.generate_jinja_code(), context)
+
+    assert render_classes(builder.generate_jinja_code_fused(), context) == expected
+
+
+def test_fused_keeps_conditional_order():
+    """Enum classes are not moved ahead of or behind interleaved conditionals."""
+    builder = build_mixed_builder()
+    context = {'kind': 'primary', 'disabled': False, 'size': 'md'}
+
+    assert render_classes(builder.generate_jinja_code_fused(), context) == [
+        'btn', 'btn--primary', 'btn--primary-extra', 'btn--md', 'btn--enabled',
+    ]
+
+
+def test_fused_applies_name_mappings():
+    """Reserved variable names are mapped in folded enum chains too."""
+    builder = ClassBuilder()
+    builder.add_enum_classes('type', {'a': ['is-a'], 'b': ['is-b']})
+    code = builder.generate_jinja_code_fused(name_mappings={'type': 'type_'})
+
+    assert "type_ == 'a'" in code
+    assert render_classes(code, {'type_': 'b'}) == ['is-b']
+
+
+def build_conditional_builder():
+    """Builder using every kind of condition compile_to_python accepts."""
+    builder = ClassBuilder()
+    builder.add_base_classes(['btn'])
+    builder.add_computed_var('computed_size', "'lg' if size == 'xl' else size")
+    builder.add_enum_classes('kind', {'primary': ['btn--primary'], 'secondary': ['btn--secondary']})
+    builder.add_boolean_class('disabled', 'btn--disabled')
+    builder.add_boolean_class('disabled', 'btn--enabled', negate=True)
+    builder.add_conditional_class('btn--not-primary', "kind != 'primary'")
+    builder.add_conditional_class('btn--active', "state in ['open', 'busy']")
+    builder.add_conditional_class('btn--either', "disabled or kind == 'secondary'")
+    builder.add_conditional_class('btn--large', "computed_size == 'lg'")
+    builder.add_conditional_class('btn--sized', 'computed_size')
+    builder.add_template_class("${state ? 'btn--stateful' : 'btn--stateless'}", 'kind')
+    return builder
+
+
+@pytest.mark.parametrize('context', CONTEXTS)
+def test_compile_to_python_matches_jinja_code(context):
+    """The compiled function builds the classes the Jinja code renders."""
+    builder = build_conditional_builder()
+    expected = render_classes(builder.generate_jinja_code(), context)
+
+    assert builder.class_list(context) == expected
+
+
+@pytest.mark.parametrize('condition', [
+    'kind is defined',
+    'kind is not none',
+    'item.active',
+    "kind == none",
+    "kind == state",
+    "'a' in kind",
+    "size > 2",
+    'kind | length',
+])
+def test_compile_to_python_rejects_jinja_only_conditions(condition):
+    """Conditions that may evaluate differently in Python are left to Jinja."""
+    builder = ClassBuilder()
+    builder.add_conditional_class('has-kind', condition)
+
+    with pytest.raises(ValueError):
+        builder.compile_to_python()
+
+
+def test_compile_to_python_rejects_variables_in_class_names():
+    """An unset variable renders as '' in Jinja, so interpolation stays in Jinja."""
+    builder = ClassBuilder()
+    builder.add_template_class('btn--${kind}')
+
+    with pytest.raises(ValueError):
+        builder.compile_to_python()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the React to Jinja conversion.
+Converts the sample components in tests/fixtures/rvo and compares the
+output with the templates, definitions and review documents in
+tests/fixtures/conversion_expected.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from jinja2 import Environment
+
+from conversion import convert_component
+from conversion.convert_component import ComponentConverter
+from conversion.generators import jinja_generator
+from conversion.generators.definition_generator import DefinitionGenerator
+from conversion.generators.jinja_generator import JinjaGenerator
+from conversion.parsers import base_component_resolver
+from conversion.parsers.content_parser import ContentElement
+from conversion.parsers.interface_parser import AttributeInfo
+from conversion.parsers.js_parser import parse_utrecht_library
+from conversion.parsers.switch_parser import SwitchParser
+from conversion.utils.file_helpers import compute_hash, list_dir_names, read_json, write_json
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+COMPONENTS_DIR = FIXTURES_DIR / 'rvo' / 'components'
+EXPECTED_DIR = FIXTURES_DIR / 'conversion_expected'
+EXPECTED_FILES = sorted(str(path.relative_to(EXPECTED_DIR)) for path in EXPECTED_DIR.rglob('*') if path.is_file())
+
+
+@pytest.fixture(scope='module')
+def converted(tmp_path_factory):
+    """Convert the sample components into a temporary output directory."""
+    output_dir = tmp_path_factory.mktemp('converted')
+    write_definition = DefinitionGenerator.write_definition
+
+    def write_definition_to_output(self, definition, output_path):
+        write_definition(self, definition, str(output_dir / Path(output_path).name))
+
+    with pytest.MonkeyPatch.context() as mp:
+        # Nested components are resolved relative to the directory holding 'rvo'
+        mp.chdir(FIXTURES_DIR)
+        mp.setattr(convert_component, 'get_rvo_components_dir', lambda: COMPONENTS_DIR)
+        mp.setattr(convert_component, 'get_output_template_dir', lambda: output_dir)
+        mp.setattr(convert_component, 'get_conversion_dir', lambda: output_dir)
+        mp.setattr(DefinitionGenerator, 'write_definition', write_definition_to_output)
+        # Keep the output independent of a local Utrecht library checkout
+        mp.setattr(jinja_generator, 'parse_utrecht_library', lambda component_name: None)
+        mp.setattr(base_component_resolver, 'parse_utrecht_library', lambda component_name: None)
+        jinja_generator._utrecht_element_tags.cache_clear()
+        try:
+            ComponentConverter('sample-button').convert()
+            ComponentConverter('sample-steps').convert()
+            ComponentConverter(
+                str(COMPONENTS_DIR / 'sample-button' / 'src' / 'template.tsx'),
+                output_name='sample-button-copy'
+            ).convert()
+        finally:
+            jinja_generator._utrecht_element_tags.cache_clear()
+
+    return output_dir
+
+
+def test_conversion_writes_expected_files(converted):
+    """Every component, including the nested one, gets its three output files."""
+    generated = sorted(str(path.relative_to(converted)) for path in converted.rglob('*') if path.is_file())
+
+    assert generated == EXPECTED_FILES
+
+
+@pytest.mark.parametrize('file_name', EXPECTED_FILES)
+def test_conversion_output_unchanged(converted, file_name):
+    """Generated output matches the expected output byte for byte."""
+    expected = (EXPECTED_DIR / file_name).read_text(encoding='utf-8')
+
+    assert (converted / file_name).read_text(encoding='utf-8') == expected
+
+
+CONTENT_ATTRIBUTES = [
+    AttributeInfo('label', ['string'], False),
+    AttributeInfo('children', ['string'], False),
+    AttributeInfo('showIcon', ['enum'], False, ['no', 'before']),
+]
+
+
+@pytest.mark.parametrize('elements, expected', [
+    ([], ''),
+    ([ContentElement('variable', content='label')], '{{ label }}'),
+    (
+        [ContentElement('fallback', fallback_chain=['children', 'label'])],
+        '{{ _component_context.content if _component_context.content else label | safe }}',
+    ),
+    (
+        [ContentElement('fallback', fallback_chain=['children', 'label', "'Default'"])],
+        "{{ _component_context.content if _component_context.content else label if label else 'Default' | safe }}",
+    ),
+    (
+        [
+            ContentElement('conditional', condition="showIcon === 'before'", content='label'),
+            ContentElement('variable', content='label'),
+        ],
+        "{% if showIcon == 'before' %}{{ label }}{% endif %}{{ label }}",
+    ),
+    (
+        [ContentElement('children_passthrough', condition='children')],
+        '{% if children %}{{ children | safe }}{% endif %}',
+    ),
+    (
+        [ContentElement('ternary', condition='children', fallback_chain=['children', 'label'])],
+        '{{ _component_context.content | safe if _component_context.content else label }}',
+    ),
+    # Multi-line parts put every part on its own line
+    (
+        [
+            ContentElement('fallback_chain', fallback_chain=[
+                {'type': 'children_passthrough', 'condition': 'children'},
+                {'type': 'children_passthrough', 'condition': 'label'},
+            ]),
+            ContentElement('variable', content='label'),
+        ],
+        '    {% if children %}\n'
+        '        {{ children | safe }}\n'
+        '    {% elif label %}\n'
+        '        {{ children | safe }}\n'
+        '    {% endif %}\n'
+        '{{ label }}',
+    ),
+    # Element types without a handler are skipped
+    ([ContentElement('text', content='x'), ContentElement('variable', content='label')], '{{ label }}'),
+])
+def test_generate_content_from_elements(elements, expected):
+    """Each content element type is dispatched to its handler."""
+    generator = JinjaGenerator('sample')
+
+    assert generator._generate_content_from_elements(elements, CONTENT_ATTRIBUTES) == expected
+
+
+@pytest.mark.parametrize('context, expected', [
+    ({'_component_context': {'content': 'Content'}, 'label': 'Label'}, 'Content'),
+    ({'_component_context': {}, 'label': 'Label'}, 'Label'),
+    ({'_component_context': {}, 'label': ''}, 'Default'),
+    ({'_component_context': {}}, 'Default'),
+])
+def test_fallback_chain_renders_first_set_value(context, expected):
+    """A fallback chain of three values renders the first truthy one."""
+    element = ContentElement('fallback', fallback_chain=['children', 'label', "'Default'"])
+    content = JinjaGenerator('sample')._generate_content_from_elements([element], CONTENT_ATTRIBUTES)
+
+    assert Environment().from_string(content).render(**context) == expected
+
+
+SWITCH_SOURCE = """
+let appearance = undefined;
+switch (kind) {
+  case 'start':
+  case 'end':
+    appearance = 'start-end';
+    break;
+  case 'custom':
+    appearance = kind;
+    break;
+  default:
+    appearance = %s;
+}
+"""
+
+
+@pytest.mark.parametrize('default, expected', [
+    ("'primary'", "'start-end' if kind == 'start' or kind == 'end' else kind if kind == 'custom' else 'primary'"),
+    ('other', "'start-end' if kind == 'start' or kind == 'end' else kind if kind == 'custom' else other"),
+])
+def test_switch_to_jinja_expr(default, expected):
+    """Only variable results are referenced; literal strings stay quoted."""
+    mapping, = SwitchParser().extract_from_source(SWITCH_SOURCE % default)
+
+    assert ComponentConverter('sample-button')._switch_to_jinja_expr(mapping) == expected
+
+
+def test_compute_hash_is_cached_sha256():
+    """Repeated hashes of one source come from the cache."""
+    content = 'export const Sample = () => null;\n'
+    expected = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    assert compute_hash(content) == expected
+    hits = compute_hash.cache_info().hits
+    assert compute_hash(content) == expected
+    assert compute_hash.cache_info().hits == hits + 1
+    assert compute_hash(content + ' ') != expected
+
+
+def test_list_dir_names(tmp_path):
+    """Directory listings are cached, and missing directories list as empty."""
+    (tmp_path / 'template.tsx').write_text('')
+    (tmp_path / 'src').mkdir()
+
+    names = list_dir_names(tmp_path)
+    assert names == {'template.tsx', 'src'}
+    assert list_dir_names(tmp_path) is names
+    assert list_dir_names(tmp_path / 'missing') == frozenset()
+    assert list_dir_names(tmp_path / 'template.tsx') == frozenset()
+
+
+
+
+def test_locate_source_override_ignores_cached_listing(tmp_path):
+    """A source override is found even if its directory was listed before it existed."""
+    list_dir_names(tmp_path)
+    tsx_file = tmp_path / 'template.tsx'
+    tsx_file.write_text('')
+
+    converter = ComponentConverter(str(tsx_file))
+
+    assert converter._locate_source_files() == (str(tsx_file), None)
+
+
+@pytest.mark.parametrize('trailing_newline', [True, False])
+def test_write_json_matches_json_dumps(tmp_path, trailing_newline):
+    """Written JSON matches json.dumps and reads back through read_json."""
+    data = {'naam': 'Knöp', 'sizes': {1: 'sm', 2: 'md'}, 'ratio': float('nan'), 'big': 2 ** 70}
+    path = tmp_path / 'definitions.json'
+    expected = json.dumps(data, indent=2, ensure_ascii=False) + ('\n' if trailing_newline else '')
+
+    write_json(path, data, trailing_newline=trailing_newline)
+
+    assert path.read_text(encoding='utf-8') == expected
+    # Compared serialized, since NaN != NaN
+    assert json.dumps(read_json(path)) == json.dumps(json.loads(expected))
+
+
+def test_read_source_reads_each_file_once(monkeypatch):
+    """Conversion steps sharing a source file share one read."""
+    reads = []
+
+    def read_file(file_path):
+        reads.append(file_path)
+        return 'source'
+
+    monkeypatch.setattr(convert_component, 'read_file', read_file)
+    converter = ComponentConverter('sample-button')
+
+    assert converter._read_source('template.tsx') == 'source'
+    assert converter._read_source('template.tsx') == 'source'
+    assert converter._read_source('defaultArgs.ts') == 'source'
+    assert reads == ['template.tsx', 'defaultArgs.ts']
+
+
+def test_parse_utrecht_library_without_library():
+    """Without the Utrecht bundle nothing is found, and the lookup is cached."""
+    if parse_utrecht_library('SampleMissingComponent') is not None:
+        pytest.skip('Utrecht component library is installed')
+
+    hits = parse_utrecht_library.cache_info().hits
+    assert parse_utrecht_library('SampleMissingComponent') is None
+    assert parse_utrecht_library.cache_info().hits == hits + 1
+
+
+@pytest.fixture
+def utrecht_element_tags():
+    """Clear the Utrecht tag cache around a test."""
+    jinja_generator._utrecht_element_tags.cache_clear()
+    yield jinja_generator._utrecht_element_tags
+    jinja_generator._utrecht_element_tags.cache_clear()
+
+
+def test_utrecht_element_tags(monkeypatch, utrecht_element_tags):
+    """Tags are built from the primary element and parsed once per component."""
+    lookups = []
+
+    def parse(component_name):
+        lookups.append(component_name)
+        primary = SimpleNamespace(tag='fieldset', classes=['utrecht-form-fieldset', 'utrecht-form-fieldset--html'])
+        return SimpleNamespace(primary_element=primary)
+
+    monkeypatch.setattr(jinja_generator, 'parse_utrecht_library', parse)
+
+    expected = ('<fieldset class="utrecht-form-fieldset utrecht-form-fieldset--html">', '</fieldset>')
+    assert utrecht_element_tags('Fieldset') == expected
+    assert utrecht_element_tags('Fieldset') == expected
+    assert lookups == ['Fieldset']
+
+
+def test_utrecht_element_tags_unavailable(monkeypatch, utrecht_element_tags):
+    """Missing or unreadable components cannot be inlined."""
+    def parse(component_name):
+        if component_name == 'Unreadable':
+            raise OSError('bundle not readable')
+        return None
+
+    monkeypatch.setattr(jinja_generator, 'parse_utrecht_library', parse)
+
+    assert utrecht_element_tags('Missing') is None
+    assert utrecht_element_tags('Unreadable') is None